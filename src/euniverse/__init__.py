@@ -1,5 +1,7 @@
 import os
 
+from ._version import __version__
+
 def get_resource(filename):
     """Get the absolute path to a resource file within the package."""
     return os.path.join(os.path.dirname(__file__), filename)
@@ -0,0 +1,2 @@
+# Single source of the package version; pyproject.toml reads it at build time.
+__version__ = "1.0.0"
@@ -62,12 +62,13 @@ import warnings
 import numpy as np
 from astropy.table import Table
 from astropy.io import fits
-from astropy.coordinates import SkyCoord
 import astropy.units as u
 
 from PyQt5.QtCore import QObject, pyqtSignal, QRectF
 from PyQt5.QtWidgets import QGraphicsEllipseItem
-from PyQt5.QtGui import QPen, QColor
+from PyQt5.QtGui import QColor
+
+from .pens import shared_pen
 
 
 # ---------------------------------------------------------------------------
@@ -111,6 +112,9 @@ class CatalogManager(QObject):
         If provided, the three signals above are automatically connected to
         the corresponding ImageViewer methods.  Pass None to wire signals
         manually (e.g. in unit tests).
+    load : bool, optional
+        Load the catalog during construction (default).  Pass False to wire
+        signals first and call load() afterwards, e.g. from CatalogLoader.
     """
 
     status_updated              = pyqtSignal(str, int)
@@ -118,7 +122,7 @@ class CatalogManager(QObject):
     view_center_requested       = pyqtSignal(float, float)
 
     def __init__(self, tileID: str, wcs, search_dir: str = ".",
-                 image_viewer=None):
+                 image_viewer=None, load: bool = True):
         super().__init__()
 
         self.tileID     = tileID
@@ -134,6 +138,10 @@ class CatalogManager(QObject):
         # QGraphicsEllipseItem lists — added to / removed from the scene by ImageViewer
         self.MER_items          = []   # Full catalog overlay
         self.selected_MER_items = []   # Lasso-selected subset
+        # Scene (x, y) centres parallel to MER_items, for vectorised click tests
+        self.MER_centers        = np.empty((0, 2))
+        # OBJECT_ID -> MER_items ellipse, for table row lookups
+        self.MER_by_id          = {}
 
         # Wire signals → ImageViewer if one was provided at construction time
         if image_viewer is not None:
@@ -142,6 +150,12 @@ class CatalogManager(QObject):
             self.view_center_requested.connect(image_viewer.centerOn)
 
         # Load the catalog immediately so numsources is valid after __init__
+        self.numsources = 0
+        if load:
+            self.load()
+
+    def load(self):
+        """Load the catalog and update numsources."""
         self.load_catalog()
         self.numsources = self.get_catalog_row_count()
 
@@ -298,7 +312,7 @@ class CatalogManager(QObject):
         positive x-axis (East = right).
         """
         item = QGraphicsEllipseItem(QRectF(x - a, y - b, 2 * a, 2 * b))
-        item.setPen(QPen(color, width))
+        item.setPen(shared_pen(color, width))
         item.setTransformOriginPoint(x, y)
         item.setRotation(90 - pa)
         item.setData(0, obj_id)
@@ -314,7 +328,7 @@ class CatalogManager(QObject):
         in self.MER_items.
 
         The items are NOT added to the scene here — that is the responsibility
-        of ImageViewer.toggle_MER(), which must run on the main thread.
+        of ImageViewer.set_MER_visible(), which must run on the main thread.
 
         Parameters
         ----------
@@ -330,7 +344,9 @@ class CatalogManager(QObject):
             print("No WCS — cannot overlay MER catalog")
             return
 
-        self.MER_items = []
+        self.MER_items   = []
+        self.MER_centers = np.empty((0, 2))
+        self.MER_by_id   = {}
         try:
             required = ['OBJECT_ID', 'RIGHT_ASCENSION', 'DECLINATION',
                         'SEMIMAJOR_AXIS', 'POSITION_ANGLE', 'ELLIPTICITY']
@@ -345,8 +361,7 @@ class CatalogManager(QObject):
             pa  = self.catalog['POSITION_ANGLE'].data
             ids = self.catalog['OBJECT_ID'].data
 
-            sky  = SkyCoord(ra=ra, dec=dec, unit='deg', frame='icrs')
-            x, y = self.wcs.world_to_pixel(sky)
+            x, y = self.wcs.worlds_to_pixels(ra, dec)
             y    = image_height - y   # FITS y-flip
 
             # Scale SourceExtractor semi-axes to better approximate visual extent
@@ -358,6 +373,8 @@ class CatalogManager(QObject):
                     self._make_ellipse(x[i], y[i], a_px[i], b_px[i], pa[i],
                                        QColor(255, 0, 0), 1, ids[i])
                 )
+            self.MER_centers = np.column_stack((x, y))
+            self.MER_by_id   = {item.data(0): item for item in self.MER_items}
 
             self.status_updated.emit(
                 f"Retrieved {len(self.MER_items)} sources from MER catalog", 3000
@@ -411,8 +428,7 @@ class CatalogManager(QObject):
             pa   = sub['POSITION_ANGLE'].data
             ids  = sub['OBJECT_ID'].data
 
-            sky  = SkyCoord(ra=ra, dec=dec, unit='deg', frame='icrs')
-            x, y = self.wcs.world_to_pixel(sky)
+            x, y = self.wcs.worlds_to_pixels(ra, dec)
             y    = image_height - y
 
             a_px = 3 * a
@@ -443,7 +459,9 @@ class CatalogManager(QObject):
         Scene removal is handled by ImageViewer.clear_MER(); this method
         only clears the Python-side reference list.
         """
-        self.MER_items = []
+        self.MER_items   = []
+        self.MER_centers = np.empty((0, 2))
+        self.MER_by_id   = {}
 
     def clear_selected_MER(self):
         """
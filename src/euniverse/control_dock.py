@@ -51,29 +51,23 @@ from PyQt5.QtWidgets import (
     QApplication, QLabel, QListWidget, QSlider, QWidget, QPushButton,
     QHBoxLayout, QFrame, QVBoxLayout,
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QCursor, QIcon
-from PyQt5.QtCore import Qt, QPointF, QRectF, QSize, QThread
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QPainterPath, QPen, QColor, QCursor, QIcon
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize, QThread, QTimer
 from PyQt5 import uic
 import os
 import getpass
 from datetime import datetime
-import csv
-from astropy.coordinates import SkyCoord
-import astropy.units as u
 import numpy as np
 
-from .generate_icons import *
-from .table_dialog import TableDialog
-from .catalog_plotter import PlotDialog
+from .generate_icons import (
+    create_sunglasses_icon, create_MER_icon, create_scatter_plot_icon,
+    create_camera_icon,
+)
 from .workers import CsvUploader
 
-# Define NA as a recognized unit so the parser doesn't complain
-try:
-    # Try the version 5.x/6.x way
-    u.def_unit('NA', u.dimensionless_unscaled, register_to_subclass=True)
-except (TypeError, ValueError):
-    # Fallback for Astropy < 5.0 OR Astropy >= 7.0
-    u.def_unit('NA', u.dimensionless_unscaled)
+# astropy, csv, and the table / plot dialogs (astropy.table, matplotlib) are
+# imported inside the methods that use them so they stay off the startup path.
+# The 'NA' astropy unit is registered by image_viewer.py at import time.
 
 
 class CustomSlider(QSlider):
@@ -91,6 +85,9 @@ class ControlDock(QWidget):
         super().__init__()
         self.viewer = viewer
         self.viewcenter = None
+        # Last (min, max) pushed to the preview callback; repeated identical
+        # slider values are not re-stretched.
+        self._last_preview_lohi = None
         self.table_dialog = None
         self.plot_dialog = None
         self.is_viewer_displaying_preview = False
@@ -195,6 +192,8 @@ class ControlDock(QWidget):
             else:
                 QListWidget.keyPressEvent(self.coord_list, event)
         self.coord_list.keyPressEvent = coord_list_key_press  # Install the handler
+        # All rows are single-line text, so Qt can skip per-row size hints
+        self.coord_list.setUniformItemSizes(True)
 
 #        self.setLayout(main_layout)
 
@@ -228,6 +227,17 @@ class ControlDock(QWidget):
         self.slider_press_callback = None
         self.coord_list.itemClicked.connect(self.on_coord_list_item_clicked)
         self.selected_circle = None
+
+        self._mag_pen = QPen(QColor(255, 0, 0), 1, Qt.SolidLine)
+        self._mag_crosshair = None   # (QSize, QPainterPath) cached per magnified size
+
+        # Navigator thumbnail, cached per (pixmap.cacheKey(), label size)
+        self._preview_frame_pen = QPen(Qt.white, 2)
+        self._preview_cache_key = None
+        self._preview_base_scaled = None
+        self._preview_xscale = 1.0
+        self._preview_yscale = 1.0
+
         self.set_black_squares()
 
     def update_status(self, message, timeout=5000):
@@ -281,6 +291,7 @@ class ControlDock(QWidget):
         timestamp  = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
         csv_filename = f"{self.viewer.dirpath}/{base_name}_{username}_{timestamp}.csv"
 
+        import csv
         with open(csv_filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['RA', 'Dec', 'Classifier'])
@@ -297,6 +308,7 @@ class ControlDock(QWidget):
         timestamp    = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_filename = f"{self.viewer.dirpath}/image_{username}_{timestamp}.csv"
 
+        import csv
         with open(csv_filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['RA', 'Dec', 'Classifier'])
@@ -318,30 +330,52 @@ class ControlDock(QWidget):
         # Save the current view centre so we can restore it after the full pass
         self.viewcenter = self.viewer.get_current_view_center()
         # Hide the MER catalog overlay (too many items slows redraws during drag)
-        if self.MER_PushButton.isChecked():
-            self.viewer.toggle_MER()
+        self.viewer.set_MER_visible(False)
         # Capture the visible uint16 crop once, before any slider movement
         if self.slider_press_callback:
             self.slider_press_callback()
+        # The crop is new, so the first tick must always be stretched
+        self._last_preview_lohi = None
 
     def slider_changed(self):
-        # Fast numexpr preview on the pre-captured crop
+        # Fast LUT preview on the pre-captured crop
+        lohi = (self.min_slider.value(), self.max_slider.value())
+        if lohi == self._last_preview_lohi:
+            return
+        self._last_preview_lohi = lohi
         if self.contrast_callback:
-            self.contrast_callback(self.min_slider.value(), self.max_slider.value())
+            self.contrast_callback(*lohi)
 
     def slider_released(self):
-        # Full LUT pass on the entire original_image
+        # Full LUT pass on the entire original_image.  It runs in a worker
+        # thread, so the wait cursor is shown by the live event loop and the
+        # rest of the release handling continues in on_full_contrast_done.
+        lohi = (self.min_slider.value(), self.max_slider.value())
+        if lohi == self.viewer.contrast_range and not self.viewer.is_displaying_preview:
+            # Nothing moved since the last full pass; the scene is current
+            self.finish_slider_release()
+            return
         if self.full_contrast_callback:
             QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
-            QApplication.processEvents()
-            self.full_contrast_callback(self.min_slider.value(), self.max_slider.value())
-            QApplication.restoreOverrideCursor()
+            # Block new slider drags until the pass has landed
+            self.min_slider.setEnabled(False)
+            self.max_slider.setEnabled(False)
+            self.full_contrast_callback(*lohi, self.on_full_contrast_done)
+        else:
+            self.finish_slider_release()
+
+    def on_full_contrast_done(self):
+        QApplication.restoreOverrideCursor()
+        self.min_slider.setEnabled(True)
+        self.max_slider.setEnabled(True)
+        self.finish_slider_release()
+
+    def finish_slider_release(self):
         # Discard the preview crop now that the full-image LUT pass is done.
         # Using the named method keeps us from poking private attributes directly.
         self.viewer.discard_preview_crop()
         # Restore MER overlay if it was visible before
-        if self.MER_PushButton.isChecked():
-            self.viewer.toggle_MER()
+        self.viewer.set_MER_visible(self.MER_PushButton.isChecked())
         # Restore scroll position
         self.viewer.restore_view_center(self.viewcenter)
                 
@@ -359,6 +393,10 @@ class ControlDock(QWidget):
         dec_str = f"{dec_sign}{dec_d:02d}:{dec_m:02d}:{dec_s:04.1f}"
         return ra_str, dec_str
 
+    def is_coord_display_visible(self) -> bool:
+        """True if the cursor coordinate labels are currently on screen."""
+        return self.equatorialRALabel.isVisible()
+
     def update_cursor_display(self, x, y, ra, dec):
         # If coordinates are None (mouse outside image)
         if x is None or y is None:
@@ -379,10 +417,16 @@ class ControlDock(QWidget):
         *entries* is viewer.annotations — a list of Annotation dataclass instances
         (see annotations.py).  Named field access replaces the old tuple unpacking.
         """
-        self.coord_list.clear()
-        for ann in entries:
-            self.coord_list.addItem(f"{ann.ra:.6f}, {ann.dec:.6f}, {ann.classifier}")
-        self.coord_list.repaint()
+        # Suspend painting while the list is rebuilt; Qt schedules a single
+        # deferred repaint once updates are re-enabled.
+        texts = [f"{ann.ra:.6f}, {ann.dec:.6f}, {ann.classifier}" for ann in entries]
+        self.coord_list.setUpdatesEnabled(False)
+        try:
+            self.coord_list.clear()
+            # One batched insert instead of one model signal per row
+            self.coord_list.addItems(texts)
+        finally:
+            self.coord_list.setUpdatesEnabled(True)
         self.submit_targets_button.setEnabled(bool(entries))
         self.save_targets_button.setEnabled(bool(entries))
 
@@ -425,24 +469,20 @@ class ControlDock(QWidget):
         # Reset the previously selected circle if it still exists
         if self.selected_circle:
             try:
-                for ann in self.viewer.annotations:
-                    if ann.item == self.selected_circle:
-                        pen = ann.item.pen()
-                        pen.setWidthF(ann.normal_thickness)
-                        ann.item.setPen(pen)
-                        break
+                ann = self.viewer.annotation_for_item(self.selected_circle)
+                if ann is not None:
+                    ann.item.setPen(self.viewer.annotation_pen(ann))
+                    # Repaint only this item's bounding rect, not the scene
+                    ann.item.update()
             except Exception:
                 pass
 
         # Find and highlight the new circle
-        for ann in self.viewer.annotations:
-            if abs(ann.ra - ra) < 1e-6 and abs(ann.dec - dec) < 1e-6:
-                pen = ann.item.pen()
-                pen.setWidthF(ann.normal_thickness * 1.5)
-                ann.item.setPen(pen)
-                self.selected_circle = ann.item
-                self.viewer.scene.update()
-                break
+        ann = self.viewer.annotation_at_radec(ra, dec, tol=1e-6)
+        if ann is not None:
+            ann.item.setPen(self.viewer.annotation_pen(ann, selected=True))
+            self.selected_circle = ann.item
+            ann.item.update()
 
     def on_coord_list_item_clicked(self, item):
         """Safely centers the viewer on a selected catalog object."""
@@ -457,12 +497,8 @@ class ControlDock(QWidget):
             ra = float(parts[0].strip())
             dec = float(parts[1].strip())
             
-            sky_coord = SkyCoord(ra * u.deg, dec * u.deg, frame='icrs')
-            x, y = self.viewer.wcs.world_to_pixel(sky_coord)
-            # Extract the first element if they are arrays
-            if isinstance(x, np.ndarray):
-                x = float(x.item() if x.size == 1 else x[0])
-                y = float(y.item() if y.size == 1 else y[0])
+            xs, ys = self.viewer.wcs.worlds_to_pixels([ra], [dec])
+            x, y   = float(xs[0]), float(ys[0])
 
             # Use pathlib-style shape access
             img_height = self.viewer.original_image.shape[0]
@@ -485,54 +521,83 @@ class ControlDock(QWidget):
         if not pixmap or pixmap.isNull():
             self.set_black_squares()
             return
-        scaled_pixmap = pixmap.scaled(
-            self.preview_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+
+        # The smooth downscale and the scale factors only change with the
+        # image or the label size; scroll/zoom refreshes reuse them.
+        key = (pixmap.cacheKey(), self.preview_label.size())
+        if self._preview_cache_key != key:
+            base = pixmap.scaled(
+                self.preview_label.size(),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            # The pixmap may be a reduced thumbnail; the frame below is drawn
+            # in scene (full image pixel) coordinates
+            img_rect = self.viewer.sceneRect() if self.viewer else QRectF(pixmap.rect())
+            self._preview_base_scaled = base
+            self._preview_xscale = base.width() / img_rect.width()
+            self._preview_yscale = base.height() / img_rect.height()
+            self._preview_cache_key = key
+
+        scaled_pixmap = self._preview_base_scaled.copy()
         painter = QPainter(scaled_pixmap)
-        painter.setPen(QPen(Qt.white, 2))
+        painter.setPen(self._preview_frame_pen)
         if self.viewer:
             view_rect = self.viewer.viewport().rect()
             scene_rect = self.viewer.mapToScene(view_rect).boundingRect()
-            img_rect = pixmap.rect()
-            x_scale = scaled_pixmap.width() / img_rect.width()
-            y_scale = scaled_pixmap.height() / img_rect.height()
-            x = scene_rect.left() * x_scale
-            y = scene_rect.top() * y_scale
-            w = scene_rect.width() * x_scale
-            h = scene_rect.height() * y_scale
+            x = scene_rect.left() * self._preview_xscale
+            y = scene_rect.top() * self._preview_yscale
+            w = scene_rect.width() * self._preview_xscale
+            h = scene_rect.height() * self._preview_yscale
             painter.drawRect(int(x), int(y), int(w), int(h))
         painter.end()
         self.preview_label.setPixmap(scaled_pixmap)
 
     def update_magnifier(self, scene_pos):
-        if not self.viewer or not self.viewer.last_pixmap:
+        """
+        Redraw the magnifier around *scene_pos*.  The viewer already
+        coalesces mouse moves to ~60 Hz before calling this, so it draws
+        immediately rather than throttling a second time.
+        """
+        if not self.viewer or not self.viewer.qimage:
             self.set_black_squares()
             return
         img_x = int(scene_pos.x())
         img_y = int(scene_pos.y())
-        image = self.viewer.last_pixmap.toImage()
-        img_width = image.width()
-        img_height = image.height()
+        # Full-resolution stretched image (last_pixmap is only a thumbnail)
+        source = self.viewer.qimage
+        img_width = source.width()
+        img_height = source.height()
         box_size = 50
         x = max(0, min(img_width - box_size, int(img_x - box_size / 2)))
         y = max(0, min(img_height - box_size, int(img_y - box_size / 2)))
-        cropped = image.copy(x, y, box_size, box_size)
-        magnified = QPixmap.fromImage(cropped).scaled(
+        # Only the 50x50 box is copied; scaling and the crosshair are done
+        # on a QImage and converted to a QPixmap once at the end.
+        cropped = source.copy(x, y, box_size, box_size)
+        magnified = cropped.convertToFormat(QImage.Format_RGB32).scaled(
             self.magnifier_label.size(),
             Qt.KeepAspectRatio,
             Qt.FastTransformation
         )
         painter = QPainter(magnified)
-        painter.setPen(QPen(QColor(255, 0, 0), 1, Qt.SolidLine))
-        crosshair_length = int(0.1 * min(magnified.width(), magnified.height()))
-        center_x = magnified.width() // 2
-        center_y = magnified.height() // 2
-        painter.drawLine(center_x, center_y - crosshair_length // 2, center_x, center_y + crosshair_length // 2)
-        painter.drawLine(center_x - crosshair_length // 2, center_y, center_x + crosshair_length // 2, center_y)
+        painter.setPen(self._mag_pen)
+        painter.drawPath(self._magnifier_crosshair(magnified.size()))
         painter.end()
-        self.magnifier_label.setPixmap(magnified)
+        self.magnifier_label.setPixmap(QPixmap.fromImage(magnified))
+
+    def _magnifier_crosshair(self, size):
+        """Return the centred crosshair path for a magnifier of *size*, cached."""
+        if self._mag_crosshair is None or self._mag_crosshair[0] != size:
+            crosshair_length = int(0.1 * min(size.width(), size.height()))
+            center_x = size.width() // 2
+            center_y = size.height() // 2
+            path = QPainterPath()
+            path.moveTo(center_x, center_y - crosshair_length // 2)
+            path.lineTo(center_x, center_y + crosshair_length // 2)
+            path.moveTo(center_x - crosshair_length // 2, center_y)
+            path.lineTo(center_x + crosshair_length // 2, center_y)
+            self._mag_crosshair = (size, path)
+        return self._mag_crosshair[1]
 
     def preview_mouse_press(self, event):
         if event.button() == Qt.LeftButton:
@@ -544,7 +609,8 @@ class ControlDock(QWidget):
             self.handle_preview_drag(event.pos())
 
         # Coordinate display — works independently of dragging
-        if not self.viewer or not self.viewer.wcs or self.viewer.original_image is None:
+        if (not self.viewer or not self.viewer.wcs
+                or self.viewer.original_image is None or not self.viewer.qimage):
             return
         pm = self.preview_label.pixmap()
         if not pm or pm.isNull():
@@ -553,8 +619,8 @@ class ControlDock(QWidget):
         # Map label pixel → full-resolution image pixel (same ratio used in handle_preview_drag)
         scaled_w = pm.width()
         scaled_h = pm.height()
-        image_w = self.viewer.last_pixmap.width()
-        image_h = self.viewer.last_pixmap.height()
+        image_w = self.viewer.qimage.width()
+        image_h = self.viewer.qimage.height()
         img_x = event.pos().x() * (image_w / scaled_w)
         img_y = event.pos().y() * (image_h / scaled_h)
 
@@ -576,12 +642,12 @@ class ControlDock(QWidget):
             self.dragging = False
 
     def handle_preview_drag(self, pos):
-        if not self.viewer or not self.viewer.last_pixmap:
+        if not self.viewer or not self.viewer.qimage:
             return
         scaled_width = self.preview_label.pixmap().width() if self.preview_label.pixmap() else 1
         scaled_height = self.preview_label.pixmap().height() if self.preview_label.pixmap() else 1
-        image_width = self.viewer.last_pixmap.width()
-        image_height = self.viewer.last_pixmap.height()
+        image_width = self.viewer.qimage.width()
+        image_height = self.viewer.qimage.height()
         x_ratio = image_width / scaled_width
         y_ratio = image_height / scaled_height
         img_x = pos.x() * x_ratio
@@ -600,6 +666,7 @@ class ControlDock(QWidget):
                 if self.plot_dialog is not None:
                     self.plot_dialog.close()
                     self.plot_dialog = None
+                from .catalog_plotter import PlotDialog
                 self.plot_dialog = PlotDialog(
                     self.viewer.catalog_manager,
                     self.viewer,
@@ -642,49 +709,59 @@ class ControlDock(QWidget):
             return
 
         if checked:
-            # 1. Provide immediate visual feedback for heavy processing
+            # 1. Provide immediate visual feedback for heavy processing.
+            # The overlay is built on the next event-loop pass so the wait
+            # cursor gets painted first, without re-entrant processEvents().
             QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
-            QApplication.processEvents() # Force cursor update
-            
-            try:
-                # 2. Trigger the catalog overlay
-                self.viewer.toggle_MER()
-                
-                # 3. Check if a valid, non-empty catalog actually exists
-                cat_manager = self.viewer.catalog_manager
-                if cat_manager and cat_manager.catalog is not None and len(cat_manager.catalog) > 0:
-                    # Only create the dialog if it doesn't already exist
-                    if self.table_dialog is None:
-                        # Fetch the path from the catalog manager
-                        catalog_name = getattr(cat_manager, 'catalog_name', None)
-                        self.table_dialog = TableDialog(cat_manager.catalog, self.viewer, catalog_name, self)
-                        self.table_dialog.show()
-                else:
-                    # 4. Handle missing/empty data gracefully
-                    self.update_status("No MER catalog data available for this tile.")
-                    print("Warning: Attempted to show MER, but catalog is missing or empty.")
-                    
-                    # Uncheck the button since we can't fulfill the request
-                    self.MER_PushButton.blockSignals(True)
-                    self.MER_PushButton.setChecked(False)
-                    self.MER_PushButton.blockSignals(False)
-            
-            except Exception as e:
-                self.update_status(f"Error displaying MER: {e}")
-                print(f"Critical error in on_MER_toggled: {e}")
-            
-            finally:
-                # Always restore the cursor, even if an error occurs
-                QApplication.restoreOverrideCursor()
-        
+            QTimer.singleShot(0, self._show_MER)
+
         else:
             # 5. Robust cleanup when toggled off
-            self.viewer.toggle_MER()
+            self.viewer.set_MER_visible(False)
             if self.table_dialog:
                 self.table_dialog.close()
                 self.table_dialog = None
             self.update_status("MER catalog hidden.")
 
+    def _show_MER(self):
+        """Deferred second half of on_MER_toggled(True)."""
+        if not self.MER_PushButton.isChecked():
+            # Toggled off again before the deferred call ran
+            QApplication.restoreOverrideCursor()
+            return
+
+        try:
+            # 2. Show the catalog overlay (built on first use)
+            self.viewer.set_MER_visible(True)
+            
+            # 3. Check if a valid, non-empty catalog actually exists
+            cat_manager = self.viewer.catalog_manager
+            if cat_manager and cat_manager.catalog is not None and len(cat_manager.catalog) > 0:
+                # Only create the dialog if it doesn't already exist
+                if self.table_dialog is None:
+                    # Fetch the path from the catalog manager
+                    catalog_name = getattr(cat_manager, 'catalog_name', None)
+                    from .table_dialog import TableDialog
+                    self.table_dialog = TableDialog(cat_manager.catalog, self.viewer, catalog_name, self)
+                    self.table_dialog.show()
+            else:
+                # 4. Handle missing/empty data gracefully
+                self.update_status("No MER catalog data available for this tile.")
+                print("Warning: Attempted to show MER, but catalog is missing or empty.")
+                
+                # Uncheck the button since we can't fulfill the request
+                self.MER_PushButton.blockSignals(True)
+                self.MER_PushButton.setChecked(False)
+                self.MER_PushButton.blockSignals(False)
+        
+        except Exception as e:
+            self.update_status(f"Error displaying MER: {e}")
+            print(f"Critical error in on_MER_toggled: {e}")
+        
+        finally:
+            # Always restore the cursor, even if an error occurs
+            QApplication.restoreOverrideCursor()
+
 
     def reset_ui_state(self):
         """Clears all overlays and dialogs when a new image is loaded."""
@@ -25,97 +25,84 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import os
 import sys
 import logging
-import argparse
-from pathlib import Path
-from importlib.metadata import version, PackageNotFoundError
 
-from PyQt5.QtWidgets import QApplication, QMainWindow, QDockWidget, QWidget, QMessageBox
-from PyQt5.QtCore import Qt
-
-from .image_viewer import ImageViewer
-from .control_dock import ControlDock
+# PyQt5, the viewer widgets and the scientific stack are imported inside
+# main() after argument parsing, so --help and --version return immediately.
 
 # Set up basic logging to terminal
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Euniverse Explorer")
-        
-        # Centralized path management
-        self.base_path = Path(__file__).parent
-        
+# Modules the viewer only imports on first use (the plot dialog).  They are
+# warmed on a background thread once the window is up.
+_WARM_MODULES = (
+    "matplotlib.figure",
+    "matplotlib.colors",
+    "matplotlib.path",
+    "matplotlib.widgets",
+)
+
+def _warm_imports():
+    import importlib
+    for name in _WARM_MODULES:
+        if name in sys.modules:
+            continue
         try:
-            self.init_ui()
+            importlib.import_module(name)
         except Exception as e:
-            logger.error(f"Failed to initialize UI: {e}")
-            self.critical_error(f"UI Initialization failed: {e}")
-            
-        self.resize(1280, 1080)
-
-    def init_ui(self):
-        """Builds the main layout and connects components."""
-        self.setDockOptions(QMainWindow.AllowNestedDocks | QMainWindow.AnimatedDocks)
-        
-        # Set all corners to belong to left/right docks (better for widescreen)
-        self.setCorner(Qt.TopLeftCorner, Qt.LeftDockWidgetArea)
-        self.setCorner(Qt.TopRightCorner, Qt.RightDockWidgetArea)
-        self.setCorner(Qt.BottomLeftCorner, Qt.LeftDockWidgetArea)
-        self.setCorner(Qt.BottomRightCorner, Qt.RightDockWidgetArea)
-        
-        # Central widget
-        self.viewer = ImageViewer(main_window=self)
-        self.setCentralWidget(self.viewer)
-        self.setStatusBar(self.viewer.status_bar)
-        
-        # Setup Control Dock
-        self._setup_control_panel()
-        
-    def _setup_control_panel(self):
-        """Internal helper to isolate docking logic."""
-        self.control_widget = ControlDock(self.viewer)
-        self.control_dock = QDockWidget("Controls", self)
-        self.control_dock.setWidget(self.control_widget)
-        self.control_dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        
-        # Optional: Keep title bar but make it small/clean
-        # self.control_dock.setTitleBarWidget(QWidget()) 
-        
-        self.addDockWidget(Qt.LeftDockWidgetArea, self.control_dock)
-        self.viewer.set_control_dock(self.control_widget)
-
-    def critical_error(self, message):
-        """Graceful crash reporting."""
-        QMessageBox.critical(self, "Critical Error", message)
-        sys.exit(1)
-
-def main():
-    # 1. Versioning
+            logger.debug(f"Background import of {name} failed: {e}")
+    # Compile the numba ruler helper here rather than on the first drag
     try:
-        current_version = version("euniverse")
-    except PackageNotFoundError:
-        current_version = "dev-local"
+        from .wcs_utils import warm_up_jit
+        warm_up_jit()
+    except Exception as e:
+        logger.debug(f"JIT warm-up failed: {e}")
 
-    # 2. CLI Arguments
-    parser = argparse.ArgumentParser(description="euniverse: Euclid data analysis")
-    parser.add_argument('-v', '--version', action='version', version=f'%(prog)s {current_version}')
-    parser.add_argument('--debug', action='store_true', help="Enable verbose logging")
-    args = parser.parse_args()
+def _current_version():
+    # A plain module constant; no distribution-metadata scan of sys.path
+    try:
+        from ._version import __version__
+        return __version__
+    except ImportError:
+        return "dev-local"
 
-    if args.debug:
-        logger.setLevel(logging.DEBUG)
+def main():
+    # 1. CLI Arguments.  A bare "euniverse" has nothing to parse, so argparse
+    # is only imported (and the parser built) when arguments are given;
+    # --help and --version still exit here, before any Qt import.
+    debug = False
+    if len(sys.argv) > 1:
+        import argparse
+        current_version = _current_version()
+        parser = argparse.ArgumentParser(prog="euniverse", description="euniverse: Euclid data analysis")
+        parser.add_argument('-v', '--version', action='version', version=f'%(prog)s {current_version}')
+        parser.add_argument('--debug', action='store_true', help="Enable verbose logging")
+        debug = parser.parse_args().debug
+
+    if debug:
+        # Package logger, so main_window and friends inherit the level too
+        logging.getLogger("euniverse").setLevel(logging.DEBUG)
+
+    # 2. Application Lifecycle
+    import threading
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+    from .main_window import MainWindow
 
-    # 3. Application Lifecycle
     app = QApplication(sys.argv)
-    app.setStyle("Fusion")
+    # Fusion by default; EUNIVERSE_STYLE=native keeps the platform style and
+    # skips loading the Fusion style plugin
+    style = os.environ.get("EUNIVERSE_STYLE", "fusion")
+    if style.lower() != "native" and app.style().objectName().lower() != style.lower():
+        app.setStyle(style)
     
     try:
         window = MainWindow()
         window.show()
+        QTimer.singleShot(0, lambda: threading.Thread(target=_warm_imports, daemon=True).start())
         sys.exit(app.exec_())
     except Exception as e:
         logger.critical(f"Application crashed on startup: {e}", exc_info=True)
@@ -25,240 +25,341 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QPen, QBrush, QColor, QPainterPath
-from PyQt5.QtCore import Qt, QRectF
-
-def create_sunglasses_icon():
-    pixmap = QPixmap(32, 32)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+
+from PyQt5.QtGui import QIcon, QImage, QPixmap, QPixmapCache, QPainter, QPen, QBrush, QColor, QPolygonF
+from PyQt5.QtCore import Qt, QRectF, QLineF, QPointF
+
+# Icon factories are imported by name; the Qt classes above are not re-exported.
+# Each factory is memoized, so an icon is loaded or rasterised once per
+# process.  They must only be called once a QApplication exists.
+#
+# The _render_* functions paint the icons procedurally into raster QImages,
+# which are converted to a QPixmap once and kept in Qt's QPixmapCache.
+# They are the single source of the artwork: running this module
+# (python -m euniverse.generate_icons) bakes their output to icons/*.png,
+# which the factories load in preference to painting.
+__all__ = [
+    'create_sunglasses_icon', 'create_MER_icon', 'create_table_icon',
+    'create_camera_icon', 'create_scatter_plot_icon', 'create_crosshair_icon',
+    'create_lasso_icon',
+]
+
+
+def _cosmetic_pen(color, width):
+    """A pen whose width stays in device pixels under any painter transform."""
+    pen = QPen(color, width)
+    pen.setCosmetic(True)
+    return pen
+
+# Pens and brushes shared by the renderers.  The pens are cosmetic, so their
+# widths are final device pixels even inside rotated sections (MER).
+_BLACK_PEN   = _cosmetic_pen(Qt.black, 1.5)
+_BLACK_PEN_2 = _cosmetic_pen(Qt.black, 2)
+_BLUE_PEN    = _cosmetic_pen(Qt.blue, 1.5)
+_RED_PEN     = _cosmetic_pen(Qt.red, 1.5)
+_AXIS_PEN    = _cosmetic_pen(Qt.black, 1)
+_POINT_PEN   = _cosmetic_pen(QColor(0, 0, 150), 0.5)
+_BLACK_BRUSH = QBrush(Qt.black)
+_BLUE_BRUSH  = QBrush(Qt.blue)
+_RED_BRUSH   = QBrush(Qt.red)
+_WHITE_BRUSH = QBrush(Qt.white)
+_LENS_BRUSH  = QBrush(QColor(135, 206, 235))
+_POINT_BRUSH = QBrush(QColor(50, 50, 255))
+
+
+@contextmanager
+def _icon_canvas(size=32, antialias=True):
+    """Yield (painter, image) for a transparent size x size icon."""
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, antialias)
+    try:
+        yield painter, image
+    finally:
+        painter.end()
+
+def _render_sunglasses():
+    with _icon_canvas() as (painter, image):
+        # Coordinates are in final 32x32 pixels (the old 1.5x scaled layout,
+        # pre-multiplied), so the painter stays on the identity transform
     
-    # Scale symbols by 1.5x, adjust to center in 32x32
-    scale = 1.5
-    painter.translate(16, 16)  # Center of 32x32
-    painter.scale(scale, scale)
-    painter.translate(-15 / scale, -11 / scale)  # Adjust for scaled center
+        # Lenses
+        painter.setPen(_BLACK_PEN)
+        painter.setBrush(_BLACK_BRUSH)
+        painter.drawEllipse(QRectF(7, 14, 7.5, 6))     # Left lens
+        painter.drawEllipse(QRectF(17.5, 14, 7.5, 6))  # Right lens
     
-    # Lenses (original 10x8, now 15x12, scaled to fit)
-    painter.setPen(QPen(Qt.black, 1.5 / scale))
-    painter.setBrush(QBrush(Qt.black))
-    painter.drawEllipse(4, 6, 5, 4)  # Left lens
-    painter.drawEllipse(11, 6, 5, 4)  # Right lens
+        # Bridge (curved line)
+        painter.drawArc(QRectF(11.5, 14, 9, 6), 30 * 16, 120 * 16)
     
-    # Bridge (curved line)
-    painter.setPen(QPen(Qt.black, 1.5 / scale))
-    painter.drawArc(7, 6, 6, 4, 30 * 16, 120 * 16)
+        # Temples
+        painter.drawLine(QLineF(5.5, 15.5, 7, 15.5))     # Left temple
+        painter.drawLine(QLineF(25, 15.5, 26.5, 15.5))   # Right temple
+    return image
+
+def _render_MER():
+    with _icon_canvas() as (painter, image):
+        # Coordinates are in final 32x32 pixels (the old 1.5x scaled layout,
+        # pre-multiplied); only the tilt of each ellipse needs a rotation
     
-    # Temples
-    painter.drawLine(3, 7, 4, 7)  # Left temple
-    painter.drawLine(16, 7, 17, 7)  # Right temple
+        # Larger ellipse
+        painter.save()
+        painter.translate(15.5, 17)
+        painter.rotate(45)
+        painter.setPen(_BLUE_PEN)
+        painter.setBrush(_BLUE_BRUSH)
+        painter.drawEllipse(QRectF(-12, -6, 15, 7.5))
+        painter.restore()
     
-    painter.end()
-    return QIcon(pixmap)
-
-def create_MER_icon():
-    pixmap = QPixmap(32, 32)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
+        # Smaller ellipse
+        painter.save()
+        painter.translate(24.5, 23)
+        painter.rotate(-30)
+        painter.setPen(_RED_PEN)
+        painter.setBrush(_RED_BRUSH)
+        painter.drawEllipse(QRectF(-7.5, -3.375, 10.5, 6))
+        painter.restore()
+    return image
+
+def _render_table():
+    # Only axis-aligned lines and a rect: no antialiasing needed, provided
+    # the geometry sits on whole pixels and the pen width is an integer
+    with _icon_canvas(antialias=False) as (painter, image):
+        # Coordinates are in final 32x32 pixels (the old 1.8x scaled layout,
+        # snapped to integers), so the painter stays on the identity transform
     
-    # Scale symbols by 1.5x, adjust to center in 32x32
-    scale = 1.5
-    painter.translate(16, 16)
-    painter.scale(scale, scale)
-    painter.translate(-14 / scale, -14 / scale)
+        # Grid
+        painter.setPen(_BLACK_PEN_2)
+        # Horizontal and vertical lines, submitted as one batch
+        painter.drawLines([
+            QLineF(7, 9, 25, 9),
+            QLineF(7, 16, 25, 16),
+            QLineF(7, 23, 25, 23),
+            QLineF(12, 5, 12, 27),
+            QLineF(20, 5, 20, 27),
+        ])
+        # Border
+        painter.drawRect(QRectF(7, 5, 18, 22))
+    return image
+
+def _render_camera():
+    with _icon_canvas() as (painter, image):
+        # Coordinates are in final 32x32 pixels (the old 1.8x scaled layout,
+        # pre-multiplied), so the painter stays on the identity transform
     
-    # Larger ellipse (original 20x10, now 30x15, scaled to fit)
-    painter.save()
-    painter.translate(9, 10)
-    painter.rotate(45)
-    painter.setPen(QPen(Qt.blue, 1.5 / scale))
-    painter.setBrush(QBrush(Qt.blue, Qt.SolidPattern))
-    painter.drawEllipse(QRectF(-8, -4, 10, 5))
-    painter.restore()
+        # Camera body (solid black rectangle)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(_BLACK_BRUSH)
+        painter.drawRect(QRectF(5.2, 12.4, 21.6, 16.2))
     
-    # Smaller ellipse (original 10x5, now 15x7.5, scaled to fit)
-    painter.save()
-    painter.translate(15, 14)
-    painter.rotate(-30)
-    painter.setPen(QPen(Qt.red, 1.5 / scale))
-    painter.setBrush(QBrush(Qt.red, Qt.SolidPattern))
-    painter.drawEllipse(QRectF(-5, -2.25, 7, 4))
-    painter.restore()
+        # Camera lens (solid light blue circle)
+        painter.setBrush(_LENS_BRUSH)
+        painter.drawEllipse(QRectF(10.6, 16, 9, 9))
     
-    painter.end()
-    return QIcon(pixmap)
-
-def create_table_icon():
-    pixmap = QPixmap(32, 32)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
+        # Inner lens circle (solid white, slightly off-center)
+        painter.setBrush(_WHITE_BRUSH)
+        painter.drawEllipse(QRectF(14.2, 17.8, 3.6, 3.6))
     
-    # Scale symbols by 1.5x, adjust to center in 32x32
-    scale = 1.8
-    painter.translate(16, 16)
-    painter.scale(scale, scale)
-    painter.translate(-18 / scale, -18 / scale)
-    
-    # Grid (original 20x24, now 30x36, scaled to fit)
-    painter.setPen(QPen(Qt.black, 1.5 / scale))
-    # Horizontal lines
-    painter.drawLine(5, 6, 15, 6)
-    painter.drawLine(5, 10, 15, 10)
-    painter.drawLine(5, 14, 15, 14)
-    # Vertical lines
-    painter.drawLine(8, 4, 8, 16)
-    painter.drawLine(12, 4, 12, 16)
-    # Border
-    painter.drawRect(5, 4, 10, 12)
-    
-    painter.end()
-    return QIcon(pixmap)
+        # Viewfinder on top (centered)
+        painter.setBrush(_BLACK_BRUSH)
+        painter.drawRect(QRectF(12.4, 8.8, 7.2, 3.6))
+    return image
 
-def create_camera_icon():
-    pixmap = QPixmap(32, 32)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-    
-    # Scale symbols by 1.8x, adjust to center in 32x32
-    scale = 1.8
-    painter.translate(16, 16)
-    painter.scale(scale, scale)
-    painter.translate(-18 / scale, -18 / scale)
-    
-    # Camera body (solid black rectangle)
-    painter.setPen(Qt.NoPen)
-    painter.setBrush(QBrush(Qt.black))
-    painter.drawRect(4, 8, 12, 9)
-    
-    # Camera lens (solid light blue circle)
-    painter.setBrush(QBrush(QColor(135,206,235)))
-    painter.drawEllipse(7, 10, 5, 5)
-    
-    # Inner lens circle (solid white, slightly off-center)
-    painter.setBrush(QBrush(Qt.white))
-    painter.drawEllipse(9, 11, 2, 2)
-    
-    # Viewfinder on top (centered)
-    painter.setBrush(QBrush(Qt.black))
-    painter.drawRect(8, 6, 4, 2)
-    
-    painter.end()
-    return QIcon(pixmap)
 
+# Bounding rects of the scatter plot's six points (radius 2) in a 24x24 plot
+# area at (4, 4).  Normalised (x, y) positions, y up:
+# (0.2, 0.7), (0.4, 0.5), (0.6, 0.6), (0.3, 0.3), (0.5, 0.2), (0.7, 0.4)
+_SCATTER_RECTS = [QRectF(x - 2, y - 2, 4, 4) for x, y in (
+    (8.8, 11.2), (13.6, 16), (18.4, 13.6), (11.2, 20.8), (16, 23.2), (20.8, 18.4),
+)]
 
-def create_scatter_plot_icon():
+def _render_scatter_plot():
     """
     Generates a 32x32 icon that shows an x-y coordinate system with 6 closer scatter points.
     """
-    pixmap = QPixmap(32, 32)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    # Define drawing area for the plot within the icon
-    plot_left = 4
-    plot_top = 4
-    plot_width = 24
-    plot_height = 24
-
-    # Draw axes
-    axis_pen = QPen(Qt.black, 1)
-    painter.setPen(axis_pen)
-
-    # Y-axis
-    painter.drawLine(plot_left, plot_top, plot_left, plot_top + plot_height)
-    # X-axis
-    painter.drawLine(plot_left, plot_top + plot_height, plot_left + plot_width, plot_top + plot_height)
-
-    # Draw scatter points
-    point_brush = QBrush(QColor(50, 50, 255))
-    point_pen = QPen(QColor(0, 0, 150), 0.5)
-    painter.setBrush(point_brush)
-    painter.setPen(point_pen)
-
-    point_radius = 2
-
-    # Define 6 points with closer spacing
-    normalized_points = [
-        (0.2, 0.7),  # Slightly top-left
-        (0.4, 0.5),  # Center-ish
-        (0.6, 0.6),  # Slightly top-right
-        (0.3, 0.3),  # Bottom-left
-        (0.5, 0.2),  # Bottom-center
-        (0.7, 0.4)   # Bottom-right
-    ]
-
-    for px_norm, py_norm in normalized_points:
-        x_icon = plot_left + px_norm * plot_width
-        y_icon = plot_top + plot_height - py_norm * plot_height
-        painter.drawEllipse(QRectF(x_icon - point_radius, y_icon - point_radius,
-                                   2 * point_radius, 2 * point_radius))
-
-    painter.end()
-    return QIcon(pixmap)
-
-def create_crosshair_icon():
+    with _icon_canvas() as (painter, image):
+        # Define drawing area for the plot within the icon
+        plot_left = 4
+        plot_top = 4
+        plot_width = 24
+        plot_height = 24
+
+        # Draw axes
+        painter.setPen(_AXIS_PEN)
+
+        # Y-axis
+        painter.drawLine(plot_left, plot_top, plot_left, plot_top + plot_height)
+        # X-axis
+        painter.drawLine(plot_left, plot_top + plot_height, plot_left + plot_width, plot_top + plot_height)
+
+        # Draw scatter points
+        painter.setBrush(_POINT_BRUSH)
+        painter.setPen(_POINT_PEN)
+
+        for rect in _SCATTER_RECTS:
+            painter.drawEllipse(rect)
+    return image
+
+def _render_crosshair():
     """
     Generates a 32x32 icon that displays a circle with short vertical and horizontal lines
     extending outwards from its sides.
     """
-    pixmap = QPixmap(32, 32)
-    pixmap.fill(Qt.transparent)  # Start with a transparent background
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing) # For smoother lines
+    with _icon_canvas() as (painter, image):
+        # Set the pen for drawing
+        painter.setPen(_BLACK_PEN_2)  # Black color, 2 pixels wide
+
+        center_x, center_y = 16, 16
+        circle_radius = 6
+
+        # Draw the central circle
+        # QRectF(x, y, width, height) where x,y is top-left of bounding rectangle
+        painter.drawEllipse(QRectF(center_x - circle_radius, center_y - circle_radius,
+                                   2 * circle_radius, 2 * circle_radius))
+        # The stubs below are axis-aligned, on integer coordinates and drawn
+        # with the 2 px pen, so they need no antialiasing
+        painter.setRenderHint(QPainter.Antialiasing, False)
+
+        line_length = 4 # Length of the lines extending from the circle
+
+        # Draw the top, bottom, left and right lines in one batch
+        painter.drawLines([
+            QLineF(center_x, center_y - circle_radius - line_length,
+                   center_x, center_y - circle_radius),
+            QLineF(center_x, center_y + circle_radius,
+                   center_x, center_y + circle_radius + line_length),
+            QLineF(center_x - circle_radius - line_length, center_y,
+                   center_x - circle_radius, center_y),
+            QLineF(center_x + circle_radius, center_y,
+                   center_x + circle_radius + line_length, center_y),
+        ])
+    return image
+
+# The lasso loop (four quadratic Beziers through (6,6), (18,6), (18,18) and
+# (6,18), control points (12,4), (20,12), (12,20), (4,12)) flattened to eight
+# points per curve, so no curve subdivision happens at paint time
+_LASSO_POLY = QPolygonF([QPointF(x, y) for x, y in (
+    (6, 6), (7.5, 5.562), (9, 5.25), (10.5, 5.062),
+    (12, 5), (13.5, 5.062), (15, 5.25), (16.5, 5.562),
+    (18, 6), (18.438, 7.5), (18.75, 9), (18.938, 10.5),
+    (19, 12), (18.938, 13.5), (18.75, 15), (18.438, 16.5),
+    (18, 18), (16.5, 18.438), (15, 18.75), (13.5, 18.938),
+    (12, 19), (10.5, 18.938), (9, 18.75), (7.5, 18.438),
+    (6, 18), (5.562, 16.5), (5.25, 15), (5.062, 13.5),
+    (5, 12), (5.062, 10.5), (5.25, 9), (5.562, 7.5),
+)])
+
+def _render_lasso():
+    """Creates a lasso selector icon for the toolbar."""
+    with _icon_canvas(24) as (painter, image):
+        painter.setPen(_BLACK_PEN_2)
+        # Draw a lasso-like loop shape (outline only; no brush is set)
+        painter.drawPolygon(_LASSO_POLY)
+    return image
+
+
+_RENDERERS = {
+    'sunglasses': _render_sunglasses,
+    'MER': _render_MER,
+    'table': _render_table,
+    'camera': _render_camera,
+    'scatter_plot': _render_scatter_plot,
+    'crosshair': _render_crosshair,
+    'lasso': _render_lasso,
+}
+
+
+# ---------------------------------------------------------------------------
+# Baked-icon lookup
+# ---------------------------------------------------------------------------
+
+def _icon_dir():
+    return os.path.join(os.path.dirname(__file__), 'icons')
+
+
+def _icon_pixmap(name, render):
+    """
+    Return the pixmap for icon *name* through QPixmapCache.
 
-    # Set the pen for drawing
-    pen = QPen(Qt.black, 2)  # Black color, 2 pixels wide
-    painter.setPen(pen)
+    On a cache miss the pixmap is loaded from the pre-rendered
+    icons/<name>.png when present, and painted with *render* otherwise.
+    """
+    key    = f"euniverse-icon-{name}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        png_path = os.path.join(_icon_dir(), f"{name}.png")
+        if os.path.exists(png_path):
+            pixmap = QPixmap(png_path)
+        else:
+            pixmap = QPixmap.fromImage(render())
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
-    center_x, center_y = 16, 16
-    circle_radius = 6
 
-    # Draw the central circle
-    # QRectF(x, y, width, height) where x,y is top-left of bounding rectangle
-    painter.drawEllipse(QRectF(center_x - circle_radius, center_y - circle_radius,
-                               2 * circle_radius, 2 * circle_radius))
+def _load_icon(name, render):
+    """Return the icon *name* as a QIcon (see _icon_pixmap)."""
+    return QIcon(_icon_pixmap(name, render))
 
-    line_length = 4 # Length of the lines extending from the circle
 
-    # Draw the top line
-    painter.drawLine(center_x, center_y - circle_radius - line_length,
-                     center_x, center_y - circle_radius)
+# ---------------------------------------------------------------------------
+# Public factories
+# ---------------------------------------------------------------------------
 
-    # Draw the bottom line
-    painter.drawLine(center_x, center_y + circle_radius,
-                     center_x, center_y + circle_radius + line_length)
+@lru_cache(maxsize=None)
+def create_sunglasses_icon():
+    return _load_icon('sunglasses', _render_sunglasses)
 
-    # Draw the left line
-    painter.drawLine(center_x - circle_radius - line_length, center_y,
-                     center_x - circle_radius, center_y)
+@lru_cache(maxsize=None)
+def create_MER_icon():
+    return _load_icon('MER', _render_MER)
 
-    # Draw the right line
-    painter.drawLine(center_x + circle_radius, center_y,
-                     center_x + circle_radius + line_length, center_y)
+@lru_cache(maxsize=None)
+def create_table_icon():
+    return _load_icon('table', _render_table)
 
-    painter.end()
-    return QIcon(pixmap)
+@lru_cache(maxsize=None)
+def create_camera_icon():
+    return _load_icon('camera', _render_camera)
 
+@lru_cache(maxsize=None)
+def create_scatter_plot_icon():
+    return _load_icon('scatter_plot', _render_scatter_plot)
+
+@lru_cache(maxsize=None)
+def create_crosshair_icon():
+    return _load_icon('crosshair', _render_crosshair)
+
+@lru_cache(maxsize=None)
 def create_lasso_icon():
-    """Creates a lasso selector icon for the toolbar."""
-    pixmap = QPixmap(24, 24)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-    pen = QPen(Qt.black, 2)
-    painter.setPen(pen)
-    # Draw a lasso-like loop shape
-    path = QPainterPath()
-    path.moveTo(6, 6)
-    path.quadTo(12, 4, 18, 6)
-    path.quadTo(20, 12, 18, 18)
-    path.quadTo(12, 20, 6, 18)
-    path.quadTo(4, 12, 6, 6)
-    painter.drawPath(path)
-    painter.end()
-    return QIcon(pixmap)
+    return _load_icon('lasso', _render_lasso)
+
+
+# ---------------------------------------------------------------------------
+# Offline baking
+# ---------------------------------------------------------------------------
+
+def bake_icons(out_dir=None):
+    """
+    Rasterise every icon to <out_dir>/<name>.png (default: the package's
+    icons/ directory).  Once baked, the factories load the PNGs instead of
+    painting.  Requires a QGuiApplication (or QApplication).
+    """
+    out_dir = out_dir or _icon_dir()
+    os.makedirs(out_dir, exist_ok=True)
+    for name, render in _RENDERERS.items():
+        render().save(os.path.join(out_dir, f"{name}.png"), "png")
+
+
+if __name__ == "__main__":
+    # python -m euniverse.generate_icons
+    # Baking needs no widgets or windowing system: a QGuiApplication on the
+    # minimal platform plugin is enough for QImage/QPainter.
+    import sys
+    from PyQt5.QtGui import QGuiApplication
+    os.environ.setdefault("QT_QPA_PLATFORM", "minimal")
+    app = QGuiApplication(sys.argv)
+    bake_icons()
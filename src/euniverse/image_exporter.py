@@ -134,6 +134,8 @@ class ImageExporter:
     # Public export methods
     # ------------------------------------------------------------------
 
+    _RENDER_TILE = 2048   # Band size (px) for the tiled full-image render
+
     def save_full_image_with_overlays(self):
         """
         Render the entire scene at native 1:1 pixel resolution and save as PNG.
@@ -141,7 +143,8 @@ class ImageExporter:
         Steps:
           1. Zoom out to fit the whole image in the scene.
           2. Allocate a QImage sized to the scene's bounding rect.
-          3. Use QPainter + scene.render() to paint image + overlays.
+          3. Paint image + overlays into it with scene.render(), one
+             _RENDER_TILE square at a time.
           4. Save to a WCS-named file in viewer.dirpath.
           5. Restore the user's previous zoom/scroll position.
         """
@@ -166,19 +169,33 @@ class ImageExporter:
             filename = self._make_wcs_filename(centre.x(), centre.y())
 
             # Allocate render buffer sized to the full scene
-            size   = v.scene.itemsBoundingRect().size().toSize()
-            buffer = QImage(size, QImage.Format_ARGB32_Premultiplied)
+            source = v.scene.itemsBoundingRect()
+            size   = source.size().toSize()
+            buffer = QImage(size, QImage.Format_RGB32)
             buffer.fill(Qt.black)
 
+            # Render 1:1 in bands of _RENDER_TILE² pixels.  Full-resolution
+            # display pixmaps are built for one band at a time and released
+            # again, so they never exist for the whole tile at once.
             painter = QPainter(buffer)
             painter.setRenderHint(QPainter.Antialiasing)
-            v.scene.render(painter)
+            t = self._RENDER_TILE
+            for by in range(0, size.height(), t):
+                for bx in range(0, size.width(), t):
+                    bw = min(t, size.width()  - bx)
+                    bh = min(t, size.height() - by)
+                    region = QRectF(source.x() + bx, source.y() + by, bw, bh)
+                    v.ensure_full_resolution(region)
+                    v.scene.render(painter, QRectF(bx, by, bw, bh), region,
+                                   Qt.IgnoreAspectRatio)
+                    v.release_full_resolution()
             painter.end()
 
             self._save_image(buffer, filename)
 
-            # Restore the previous viewport
+            # Restore the previous viewport (and drop the off-screen tiles)
             v.fitInView(current_rect)
+            v.refresh_preview()
 
         except Exception as e:
             v.update_status(f"Error saving full image: {e}")
@@ -218,7 +235,7 @@ class ImageExporter:
 
             # Render at viewport resolution (1:1 with the screen)
             output_size = v.viewport().size()
-            buffer      = QImage(output_size, QImage.Format_ARGB32_Premultiplied)
+            buffer      = QImage(output_size, QImage.Format_RGB32)
             buffer.fill(Qt.black)
 
             painter = QPainter(buffer)
@@ -250,13 +267,16 @@ class ImageExporter:
         if v.original_image is None or not v.qimage:
             return
 
-        buffer = QImage(rect.size().toSize(), QImage.Format_ARGB32_Premultiplied)
+        buffer = QImage(rect.size().toSize(), QImage.Format_RGB32)
         buffer.fill(Qt.black)
 
+        v.ensure_full_resolution(rect)
+
         painter = QPainter(buffer)
         painter.setRenderHint(QPainter.Antialiasing)
         v.scene.render(painter, QRectF(buffer.rect()), rect)
         painter.end()
+        v.refresh_preview()
 
         filename = os.path.join(
             v.dirpath,
@@ -34,7 +34,10 @@ and handles all user interaction on it.
 Responsibilities
 ----------------
   - TIFF loading via a background TiffLoader thread (see workers.py)
-  - Contrast adjustment engine (LUT-based full pass + viewport-crop preview)
+  - Contrast adjustment engine (full pass + viewport-crop preview; Numba
+    kernel from stretch.py when available, cached LUTs otherwise)
+  - Tiled display: a thumbnail placeholder plus full-resolution pixmap
+    tiles built only for the region in view
   - MER catalog overlay management (add / remove / toggle QGraphicsEllipseItems)
   - User annotation circles (right-click to classify, left-click to select,
     Delete key to remove); stored as Annotation dataclass instances (annotations.py)
@@ -46,24 +49,29 @@ Responsibilities
 What is NOT here
 ----------------
   - File saving / PNG export  →  image_exporter.py  (ImageExporter)
-  - Background thread workers →  workers.py          (TiffLoader, CsvUploader)
+  - Background thread workers →  workers.py          (TiffLoader, CatalogLoader,
+                                                      ContrastWorker, CsvUploader)
   - Annotation data model     →  annotations.py      (Annotation dataclass)
   - Control panel UI          →  control_dock.py     (ControlDock)
   - WCS math                  →  wcs_utils.py        (WCSConverter)
+  - Contrast stretch kernel   →  stretch.py          (stretch_to_uint8)
+  - Shared overlay pens       →  pens.py             (shared_pen)
 """
 
 import os
 import re
 import gc
+import math
+import logging
+from functools import partial
 
 import numpy as np
-from PIL import Image
-from astropy.coordinates import SkyCoord
+import cv2
 import astropy.units as u
 
-from PyQt5.QtCore import Qt, QPointF, QRectF, QPoint, QThread, pyqtSignal, QObject, QSize, QSizeF
+from PyQt5.QtCore import Qt, QPointF, QRectF, QPoint, QThread, QTimer, pyqtSignal, QObject, QSize, QSizeF
 from PyQt5.QtGui import (QPixmap, QImage, QPainter, QPen, QColor, QFont,
-                         QCursor, QTransform)
+                         QCursor, QTransform, QPolygonF)
 from PyQt5.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsPixmapItem,
     QFileDialog, QApplication, QMessageBox, QMenu,
@@ -75,8 +83,10 @@ from PyQt5.QtWidgets import (
 from .annotations     import Annotation
 from .catalog_manager import CatalogManager
 from .image_exporter  import ImageExporter
-from .workers         import TiffLoader
-from .wcs_utils       import WCSConverter
+from .pens            import shared_pen
+from .workers         import TiffLoader, CatalogLoader, ContrastWorker
+from .wcs_utils       import WCSConverter, angular_separation_deg
+from .stretch         import HAVE_NUMBA, stretch_to_uint8
 
 # Astropy sometimes does not recognise the 'NA' unit used in Euclid FITS files.
 # Define it once at import time so every module that reads those files benefits.
@@ -85,6 +95,23 @@ try:
 except (TypeError, ValueError):
     u.def_unit('NA', u.dimensionless_unscaled)
 
+logger = logging.getLogger(__name__)
+
+# Tile identifier in Euclid TIFF filenames, e.g. '..._TILE101794875_...'
+_TILE_RE = re.compile(r'(TILE\d+)\D')
+
+
+def _ruler_units(deg: float):
+    """
+    (value, unit) for a ruler separation of *deg* degrees: arcseconds below
+    one arcminute, arcminutes below one degree, (None, None) beyond.
+    """
+    if deg < 1 / 60:
+        return deg * 3600, '"'
+    if deg < 1:
+        return deg * 60, "'"
+    return None, None
+
 
 class ImageViewer(QGraphicsView):
     """
@@ -121,17 +148,25 @@ class ImageViewer(QGraphicsView):
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
         self.setStyleSheet(self._scrollbar_stylesheet())
+        # With thousands of small MER ellipses, repainting the whole viewport
+        # is cheaper than Qt's per-item exposed-region bookkeeping.  With full
+        # updates, the antialiasing margin adjustment is moot, and the stock
+        # items restore their own painter state.
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
 
         # ---- Image state ----
         self.image_item     = None   # QGraphicsPixmapItem currently in the scene
         self.original_image = None   # Raw uint16 numpy array from TIFF
         self.metadata       = None   # JSON metadata dict from TIFF ImageDescription tag
         self.qimage         = None   # Full-res uint8 QImage (post-LUT), kept alive for raw-pointer safety
-        self.last_pixmap    = None   # Most recent full-image QPixmap
+        self.last_pixmap    = None   # Thumbnail QPixmap of the last full pass (≤ _THUMB_MAX px)
         self.preview_image  = None   # Downscaled thumbnail numpy array for the dock navigator
         self.wcs            = None   # WCSConverter for this tile
         self.scale_factor   = 1.0   # Cumulative zoom factor; used by reset_zoom()
         self.is_displaying_preview = False  # True while contrast slider preview crop is shown
+        self.contrast_range = None  # (min_val, max_val) of the last full contrast pass
 
         # ---- File / tile identity ----
         self.filepath   = None
@@ -141,9 +176,17 @@ class ImageViewer(QGraphicsView):
 
         # ---- Catalog and user annotations ----
         self.catalog_manager = None
+        self._highlighted_MER = None   # MER ellipse currently drawn yellow (highlight_MER)
+        self._MER_group       = None   # QGraphicsItemGroup parenting all MER_items
         # annotations replaces the old 'circles' list of 5-tuples.
         # Each element is an Annotation dataclass (see annotations.py).
         self.annotations: list = []
+        # Circle centres (scene x, y) and sky positions (ra, dec) parallel to
+        # self.annotations, for vectorised hit-testing and coordinate lookup;
+        # kept in sync by _add/_remove_annotation
+        self._annotation_xy    = np.empty((0, 2))
+        self._annotation_radec = np.empty((0, 2))
+        self._classifier_menu = None   # right-click QMenu, built once by _annotation_menu
 
         # ---- Control dock reference (injected via set_control_dock) ----
         self.control_dock = None
@@ -152,15 +195,34 @@ class ImageViewer(QGraphicsView):
         self.load_thread = None
         self.load_worker = None
 
+        # ---- Background MER catalog load thread ----
+        self.catalog_thread = None
+        self.catalog_worker = None
+
+        # ---- Background full-image contrast thread ----
+        self.contrast_thread    = None
+        self.contrast_worker    = None
+        self._contrast_callback = None   # called on the GUI thread when the pass is done
+
         # ---- Contrast engine state ----
-        # Maps (min_val, max_val) -> uint8 numpy LUT array
+        # Maps (min_val, max_val) -> uint8 numpy LUT array; only used when
+        # numba is not installed (see stretch_function)
         self.contrast_luts16: dict = {}
         # Keeps the numpy buffer alive while QImage holds a raw pointer to it
         self._contrast_buffer         = None
+        # The previously displayed buffer, recycled as the output of the next
+        # full pass so slider releases do not allocate an image-sized array
+        self._spare_buffer            = None
         # Viewport crop captured once on slider_pressed for the live preview path
         self._preview_crop_raw        = None  # uint16 numpy view / downsampled copy
         self._preview_crop_scene_pos  = None  # QPointF: top-left of crop in scene coords
         self._preview_crop_scene_size = None  # QSizeF: scene extent when downsampled
+        self._preview_out_buf         = None  # uint8 output buffer reused across slider ticks
+        # Display tiles, built lazily for the visible region on top of the
+        # thumbnail in image_item (see _update_visible_tiles).  Level n tiles
+        # are area-averaged by 2**n and cover _tile_size << n scene pixels.
+        self._tile_size = 1024
+        self._tiles: dict = {}   # (level, tx, ty) -> QGraphicsPixmapItem
 
         # ---- Mouse interaction state ----
         self.start_point        = None  # QPointF: scene pos at mouse-press
@@ -187,15 +249,41 @@ class ImageViewer(QGraphicsView):
         self.horizontal_unit    = None
         self.vertical_offset    = None
         self.vertical_unit      = None
+        # Ruler drawing tools, built once instead of on every repaint
+        self._ruler_pen      = QPen(QColor(255, 255, 0), 1, Qt.SolidLine)
+        self._ruler_pen.setCosmetic(True)
+        self._ruler_dash_pen = QPen(QColor(255, 255, 0), 1, Qt.DashLine)
+        self._ruler_dash_pen.setCosmetic(True)
+        self._ruler_text_pen = QPen(QColor(255, 255, 0), 1)
+        self._ruler_font     = QFont("Arial", 10)
 
         # ---- Sub-components ----
         # ImageExporter handles all PNG save / screenshot operations
         self.exporter   = ImageExporter(self)
         self.status_bar = QStatusBar()
 
-        # Refresh the navigator thumbnail whenever the user scrolls
-        self.horizontalScrollBar().valueChanged.connect(self.refresh_preview)
-        self.verticalScrollBar().valueChanged.connect(self.refresh_preview)
+        # Refresh tiles and the navigator thumbnail whenever the view moves.
+        # refresh_preview only arms this single-shot timer, so a burst of
+        # scroll / zoom / navigator events runs _do_refresh_preview at most
+        # once per frame (~16 ms), with the latest view, from the event loop.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._do_refresh_preview)
+        # (A slot that ignores the value: connecting to start directly would
+        # pick the start(int msec) overload and reset the interval.)
+        self.horizontalScrollBar().valueChanged.connect(self._schedule_refresh_preview)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_refresh_preview)
+
+        # Coalesce mouse moves the same way: mouseMoveEvent only records the
+        # position, and the WCS readout / rubber band / ruler work runs at
+        # most once per ~16 ms for the latest one (_process_pending_move).
+        self._pending_move_pos = None
+        self._last_int_pos     = (None, None)   # image pixel of the last processed move
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._process_pending_move)
 
         QApplication.setOverrideCursor(Qt.ArrowCursor)
 
@@ -238,7 +326,7 @@ class ImageViewer(QGraphicsView):
         Returns (raw, spaced) e.g. ('TILE101794875', 'TILE 101794875'),
         or (None, None) if the pattern is not found.
         """
-        match = re.search(r'(TILE\d+)\D', os.path.basename(filepath))
+        match = _TILE_RE.search(os.path.basename(filepath))
         if match:
             raw = match.group(1)
             return raw, raw.replace('TILE', 'TILE ')
@@ -257,7 +345,7 @@ class ImageViewer(QGraphicsView):
         dock.set_load_callback(self.open_file_dialog)
         dock.set_slider_press_callback(self.capture_preview_crop)
         dock.set_contrast_callback(self.apply_preview_contrast)
-        dock.set_full_contrast_callback(self.apply_contrast)
+        dock.set_full_contrast_callback(self.apply_contrast_async)
 
     def discard_preview_crop(self):
         """
@@ -307,12 +395,13 @@ class ImageViewer(QGraphicsView):
         self.load_worker.error.connect(self.on_load_error)
         self.load_thread.start()
 
-    def on_image_loaded(self, image: np.ndarray, metadata: dict, path: str):
+    def on_image_loaded(self, image: np.ndarray, preview: np.ndarray,
+                        metadata: dict, path: str):
         """
         Main-thread slot called by TiffLoader.finished.
 
-        Builds the initial contrast display, creates the navigator thumbnail,
-        and loads the matching MER catalog.
+        Builds the initial contrast display, stores the navigator thumbnail
+        made by the loader thread, and loads the matching MER catalog.
         """
         try:
             self.reset()
@@ -325,47 +414,31 @@ class ImageViewer(QGraphicsView):
                 raise ValueError("WCSConverter returned None")
 
             h, w = image.shape[:2]
+            self.preview_image = preview   # longest axis ≤ 1000 px
 
-            # Build a downscaled navigator thumbnail (longest axis ≤ 1000 px)
-            scale = min(1000 / max(h, w), 1.0)
-            new_h, new_w = int(h * scale), int(w * scale)
-            if image.ndim == 3:
-                self.update_status("Building navigator thumbnail …")
-                img8    = (image >> 8).astype(np.uint8) if image.dtype == np.uint16 else image.astype(np.uint8)
-                pil_img = Image.fromarray(img8).resize((new_w, new_h), Image.LANCZOS)
-                self.preview_image = np.array(pil_img)
-            else:
-                from scipy.ndimage import zoom as scipy_zoom
-                self.preview_image = scipy_zoom(image, scale, order=1)
-
-            # Apply default full-range contrast and show the image
-            self.update_status("Applying contrast …")
-            self.control_dock.max_slider.setValue(65535)
-            self.apply_contrast(0, 65535)
-            self.centerOn(QPointF(w / 2, h / 2))
-
-            # Populate the navigator with the current viewport crop
-            self.update_status("Updating navigator …")
-            self.get_visible_qimage_pixmap()
-
-            # Tile identity and MER catalog
+            # Tile identity and MER catalog.  The catalog is read in a
+            # CatalogLoader thread, overlapping the contrast pass below;
+            # _on_catalog_loaded picks it up and reports the source count.
             self.tileID, self.title = self.extract_tileID(path)
             if self.title:
                 self.set_main_window_title(f"Euniverse Explorer – {self.title}")
+            self.catalog_manager = None
             if self.tileID:
                 self.update_status("Loading MER catalog …")
-                self.catalog_manager = CatalogManager(
-                    self.tileID, self.wcs, os.path.dirname(path),
-                    image_viewer=self
-                )
+                self._start_catalog_load(self.tileID, self.wcs, os.path.dirname(path))
             else:
-                self.catalog_manager = None
                 self.update_status("No TILE id in filename — catalog skipped.")
 
+            # Apply default full-range contrast in a ContrastWorker thread so
+            # the event loop stays live; the view is centred and the navigator
+            # populated once the stretched image is on screen
+            self.control_dock.max_slider.setValue(65535)
+            self.apply_contrast_async(0, 65535, callback=partial(self._on_initial_contrast, w, h))
+
             self.default_image = path
             self.image_loaded.emit(image, metadata, path)
-            n = self.catalog_manager.numsources if self.catalog_manager else 0
-            self.update_status(f"TIFF loaded — {n} MER sources found.")
+            if not self.tileID:
+                self.update_status("TIFF loaded — 0 MER sources found.")
 
         except ValueError as ve:
             self.on_load_error(str(ve))
@@ -374,6 +447,61 @@ class ImageViewer(QGraphicsView):
 
         QApplication.restoreOverrideCursor()
 
+    def _on_initial_contrast(self, w: int, h: int):
+        """Callback for the first contrast pass of a freshly loaded image."""
+        if self.original_image is None:
+            return   # pass was aborted by reset()
+        self.centerOn(QPointF(w / 2, h / 2))
+        # Populate the navigator with the current viewport crop
+        self.get_visible_qimage_pixmap()
+
+    def _start_catalog_load(self, tileID: str, wcs, search_dir: str):
+        """Build the CatalogManager for *tileID* in a CatalogLoader thread."""
+        self._stop_catalog_thread()
+
+        self.catalog_thread = QThread()
+        self.catalog_worker = worker = CatalogLoader(tileID, wcs, search_dir, self.thread())
+        worker.moveToThread(self.catalog_thread)
+
+        # Bound to their worker, not sender(): see apply_contrast_async
+        self.catalog_thread.started.connect(worker.run)
+        worker.status_updated.connect(self.update_status)
+        worker.finished.connect(self.catalog_thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        worker.finished.connect(partial(self._on_catalog_loaded, worker))
+        worker.error.connect(self.catalog_thread.quit)
+        worker.error.connect(worker.deleteLater)
+        worker.error.connect(partial(self._on_catalog_error, worker))
+        self.catalog_thread.start()
+
+    def _on_catalog_loaded(self, worker, manager: CatalogManager):
+        """Main-thread slot called by CatalogLoader.finished."""
+        if worker is not self.catalog_worker:
+            return   # stale result for an image that has since been replaced
+        self._stop_catalog_thread()
+
+        manager.status_updated.connect(self.update_status)
+        manager.selection_display_requested.connect(self.display_selected_MER)
+        manager.view_center_requested.connect(self.centerOn)
+        self.catalog_manager = manager
+        self.update_status(f"TIFF loaded — {manager.numsources} MER sources found.")
+
+    def _on_catalog_error(self, worker, message: str):
+        """Main-thread slot called by CatalogLoader.error."""
+        if worker is not self.catalog_worker:
+            return
+        self._stop_catalog_thread()
+        self.update_status(message)
+        logger.error(message)
+
+    def _stop_catalog_thread(self):
+        """Wait for any running CatalogLoader; its result will be ignored."""
+        if self.catalog_thread:
+            self.catalog_thread.quit()
+            self.catalog_thread.wait()
+        self.catalog_thread = None
+        self.catalog_worker = None
+
     def on_load_error(self, message: str):
         """Slot for TiffLoader.error and internal on_image_loaded exceptions."""
         self.update_status(f"Error loading TIFF: {message}")
@@ -404,20 +532,23 @@ class ImageViewer(QGraphicsView):
           4. Call scene.clear() — safe now that all items are removed.
           5. Force a GC cycle.
         """
-        # 0. Abort in-flight load
+        # 0. Abort in-flight load and contrast passes
         if self.load_thread and self.load_thread.isRunning():
             self.load_thread.quit()
             self.load_thread.wait()
         self.load_thread = None
         self.load_worker = None
+        self._stop_catalog_thread()
+        pending_contrast_callback = self._stop_contrast_thread()
 
         # 1. Annotation circles (must precede scene.clear)
         self.clear_annotations()
         if self.control_dock:
             self.control_dock.set_black_squares()
 
-        # 2. MER overlays
+        # 2. MER overlays and display tiles
         self.clear_MER()
+        self._clear_tiles()
         self.image_item = None
 
         # 3. Catalog reference
@@ -427,60 +558,103 @@ class ImageViewer(QGraphicsView):
 
         # 4. Measurement state
         self.clear_measuring_state()
+        self._last_int_pos = (None, None)
 
         # 5. Large arrays and contrast buffers
         self.original_image           = None
+        self.contrast_range           = None
+        self.qimage                   = None   # wraps _contrast_buffer
         self._contrast_buffer         = None
+        self._spare_buffer            = None
         self._preview_crop_raw        = None
         self._preview_crop_scene_pos  = None
         self._preview_crop_scene_size = None
+        self._preview_out_buf         = None
+        self.contrast_luts16.clear()   # LUTs are sized for the old image's dtype
 
         # 6. Scene
         self.scene.clear()
         gc.collect()
 
+        # 7. Let an aborted contrast pass unwind the dock's wait state
+        if pending_contrast_callback:
+            pending_contrast_callback()
+
     # ------------------------------------------------------------------
     # MER catalog overlay
     # ------------------------------------------------------------------
 
-    def toggle_MER(self):
+    def set_MER_visible(self, visible: bool):
         """
         Show or hide the MER catalog ellipse overlays.
 
-        First call builds the item list from CatalogManager and adds them
-        to the scene.  Subsequent calls flip their visibility flag.
+        The first show builds the item list from CatalogManager, parents the
+        ellipses to one QGraphicsItemGroup and adds that to the scene.
+        After that only the group's visibility is set, which Qt propagates
+        to the children in C++ instead of one Python call per ellipse.
+        Hiding never builds anything.  The call is idempotent, so callers
+        pass the desired state (e.g. the MER button's checked state) rather
+        than relying on the overlay's current one.
         """
+        if not visible:
+            if self._MER_group is not None and self._MER_group.isVisible():
+                self._MER_group.setVisible(False)
+                self.scene.update()
+            return
+
         if self.catalog_manager is None or self.original_image is None:
             return
 
-        if not self.catalog_manager.MER_items:
+        if self._MER_group is None:
             # First activation — build and add all ellipses
             self.catalog_manager.get_MER(self.original_image.shape[0])
+            if not self.catalog_manager.MER_items:
+                return
+            # The group sits at the origin with no transform, so plain
+            # setParentItem keeps the ellipses where they are (addToGroup
+            # would remap every item's transform for nothing)
+            group = QGraphicsItemGroup()
+            for ellipse in self.catalog_manager.MER_items:
+                ellipse.setParentItem(group)
+            self._MER_group = group
             self.setUpdatesEnabled(False)
             try:
-                for ellipse in self.catalog_manager.MER_items:
-                    self.scene.addItem(ellipse)
-                    ellipse.setVisible(True)
+                self._add_items_batched([group])
             finally:
                 self.setUpdatesEnabled(True)
                 self.scene.update()
-        else:
-            # Toggle existing items
-            new_vis = not self.catalog_manager.MER_items[0].isVisible()
-            for ellipse in self.catalog_manager.MER_items:
-                ellipse.setVisible(new_vis)
+        elif not self._MER_group.isVisible():
+            self._MER_group.setVisible(True)
             self.scene.update()
 
+    def _add_items_batched(self, items: list):
+        """
+        Add many overlay items to the scene at once.
+
+        Inserting item by item into the BSP index costs a tree update each;
+        with indexing off the inserts are plain appends, and the index is
+        rebuilt once when BspTreeIndex is switched back on.
+        """
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            for item in items:
+                self.scene.addItem(item)
+                item.setVisible(True)
+        finally:
+            self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+
     def clear_MER(self):
         """
         Permanently remove all MER overlay items and reset the item list.
-        The next toggle_MER call will rebuild everything from scratch.
+        The next set_MER_visible(True) call will rebuild everything from scratch.
         """
+        if self._MER_group is not None:
+            if self._MER_group.scene() == self.scene:
+                self.scene.removeItem(self._MER_group)   # takes the ellipses with it
+            self._MER_group = None
         if self.catalog_manager and self.catalog_manager.MER_items:
-            for ellipse in self.catalog_manager.MER_items:
-                if ellipse.scene() == self.scene:
-                    self.scene.removeItem(ellipse)
-            self.catalog_manager.MER_items = []
+            self.catalog_manager.clear_MER()
+            self._highlighted_MER = None
             self.scene.update()
 
     def display_selected_MER(self, object_ids: list):
@@ -496,14 +670,33 @@ class ImageViewer(QGraphicsView):
         if items:
             self.setUpdatesEnabled(False)
             try:
-                for item in items:
-                    self.scene.addItem(item)
-                    item.setVisible(True)
+                self._add_items_batched(items)
                 self.centerOn(items[0].rect().center())
             finally:
                 self.setUpdatesEnabled(True)
                 self.scene.update()
 
+    def highlight_MER(self, ellipse):
+        """
+        Draw MER *ellipse* yellow and restore the previously highlighted one
+        to red, so a new selection touches two pens instead of all of them.
+        setPen schedules a repaint of just those two items; no scene-wide
+        update is needed.
+        """
+        import sip
+        prev = self._highlighted_MER
+        if prev is not None and prev is not ellipse and not sip.isdeleted(prev):
+            prev.setPen(shared_pen(QColor(255, 0, 0), 1.0))
+        ellipse.setPen(shared_pen(QColor(255, 255, 0), 1.5))
+        self._highlighted_MER = ellipse
+
+    def reset_MER_highlight(self):
+        """Restore the ellipse drawn yellow by highlight_MER (if any) to red."""
+        import sip
+        prev, self._highlighted_MER = self._highlighted_MER, None
+        if prev is not None and not sip.isdeleted(prev):
+            prev.setPen(shared_pen(QColor(255, 0, 0), 1.0))
+
     def clear_selected_MER(self):
         """Remove the lasso-selected subset of ellipses from the scene."""
         if self.catalog_manager and self.catalog_manager.selected_MER_items:
@@ -526,6 +719,33 @@ class ImageViewer(QGraphicsView):
     # User annotation circles
     # ------------------------------------------------------------------
 
+    # Right-click classifier entries per category
+    ANNOTATION_CATEGORIES = {
+        "GL":  ["lens", "arc", "multiple image", "Einstein ring", "DSPL"],
+        "AGN": ["Seyfert 1", "outflow"],
+        "Gx":  ["Emissionline", "Ring", "Polar ring", "Stream",
+                "Merger", "Irregular", "Dwarf", "weird"],
+    }
+
+    # Circle colour per classifier category (see Annotation.category)
+    ANNOTATION_COLORS = {
+        "GL":  QColor(0, 200, 255),
+        "AGN": QColor(220, 220, 0),
+        "Gx":  QColor(255, 50, 50),
+    }
+
+    def annotation_pen(self, ann: Annotation, selected: bool = False) -> QPen:
+        """
+        Return the shared QPen for *ann* in its normal or selected state.
+
+        Pens come from shared_pen (pens.py), so every circle of a kind uses
+        the same QPen, and setPen() with an identical pen is a no-op in Qt.
+        The selected state is 1.5x the annotation's normal thickness.
+        """
+        width = ann.normal_thickness * 1.5 if selected else ann.normal_thickness
+        color = self.ANNOTATION_COLORS.get(ann.category, QColor(255, 255, 255))
+        return shared_pen(color, width)
+
     def clear_annotations(self):
         """
         Remove all user annotation circles from the scene and reset the list.
@@ -541,7 +761,9 @@ class ImageViewer(QGraphicsView):
                     self.scene.removeItem(ann.item)
             except RuntimeError:
                 pass  # C++ object already gone — nothing to do
-        self.annotations = []
+        self.annotations       = []
+        self._annotation_xy    = np.empty((0, 2))
+        self._annotation_radec = np.empty((0, 2))
 
         if self.control_dock:
             self.control_dock.selected_circle = None
@@ -552,61 +774,80 @@ class ImageViewer(QGraphicsView):
             except RuntimeError:
                 pass
 
+    def _add_annotation(self, ann: Annotation):
+        """Append *ann* and record its circle centre and sky position."""
+        centre = ann.item.rect().center()
+        self.annotations.append(ann)
+        self._annotation_xy    = np.vstack([self._annotation_xy, [(centre.x(), centre.y())]])
+        self._annotation_radec = np.vstack([self._annotation_radec, [(ann.ra, ann.dec)]])
+
+    def _remove_annotation(self, ann: Annotation):
+        """Drop *ann* (by identity) and its recorded centre and sky position."""
+        i = next(k for k, a in enumerate(self.annotations) if a is ann)
+        del self.annotations[i]
+        self._annotation_xy    = np.delete(self._annotation_xy, i, axis=0)
+        self._annotation_radec = np.delete(self._annotation_radec, i, axis=0)
+
+    def annotation_for_item(self, item):
+        """Return the annotation drawn by ellipse *item* (by identity), or None."""
+        return next((a for a in self.annotations if a.item is item), None)
+
+    def annotation_at_radec(self, ra: float, dec: float, tol: float = 1e-5):
+        """Return the first annotation within *tol* degrees of (ra, dec) on both axes, or None."""
+        if not self.annotations:
+            return None
+        hits = np.flatnonzero((np.abs(self._annotation_radec - (ra, dec)) < tol).all(axis=1))
+        return self.annotations[hits[0]] if hits.size else None
+
+    def _annotation_at(self, scene_pos: QPointF, radius: float):
+        """
+        Return the annotation whose circle centre is nearest to *scene_pos*
+        and within *radius* scene pixels, or None.  One numpy distance pass
+        over all centres instead of a Python loop.
+        """
+        if not self.annotations:
+            return None
+        d2 = ((self._annotation_xy - (scene_pos.x(), scene_pos.y())) ** 2).sum(axis=1)
+        i  = int(d2.argmin())
+        return self.annotations[i] if d2[i] <= radius * radius else None
+
     # ------------------------------------------------------------------
     # Navigator thumbnail extraction
     # ------------------------------------------------------------------
 
     def get_visible_qimage_pixmap(self):
         """
-        Extract the currently visible scene area from self.qimage and store
-        it as a numpy array in self.preview_image.
+        Extract the currently visible scene area of the displayed image and
+        store it as an RGB (or grayscale) numpy array in self.preview_image.
 
         Called after the initial load and after each full contrast pass so
         the navigator thumbnail always reflects the current display state.
-        Operates on the rendered uint8 QImage so the thumbnail matches exactly
-        what is shown on screen.
+        Operates on the rendered uint8 buffer so the thumbnail matches exactly
+        what is shown on screen.  One scene unit is one image pixel, so the
+        visible scene rect indexes the buffer directly.
         """
-        if not self.scene or self.qimage is None:
+        if not self.scene or self.qimage is None or self._contrast_buffer is None:
             return
 
+        img_h, img_w = self._contrast_buffer.shape[:2]
         visible_rect = self.mapToScene(self.viewport().rect()).boundingRect()
-        image_item   = next(
-            (i for i in self.scene.items() if isinstance(i, QGraphicsPixmapItem)), None
-        )
-        if image_item is None:
-            return
-
-        intersection = visible_rect.intersected(image_item.boundingRect())
+        intersection = visible_rect.intersected(QRectF(0, 0, img_w, img_h))
         if intersection.isEmpty():
             return
 
-        tl = image_item.mapFromScene(intersection.topLeft()).toPoint()
-        br = image_item.mapFromScene(intersection.bottomRight()).toPoint()
-        x  = max(0, tl.x())
-        y  = max(0, tl.y())
-        w  = min(br.x(), self.qimage.width()  - 1) - x + 1
-        h  = min(br.y(), self.qimage.height() - 1) - y + 1
+        x  = max(0, int(intersection.left()))
+        y  = max(0, int(intersection.top()))
+        w  = min(int(intersection.right()),  img_w - 1) - x + 1
+        h  = min(int(intersection.bottom()), img_h - 1) - y + 1
 
         if w <= 0 or h <= 0:
             return
 
-        qimg = self.qimage.copy(x, y, w, h)
-        fmt  = qimg.format()
-
-        if fmt in (QImage.Format_RGB32, QImage.Format_ARGB32):
-            ptr = qimg.bits()
-            ptr.setsize(qimg.byteCount())
-            arr = np.array(ptr).reshape(qimg.height(), qimg.width(), 4)
-            self.preview_image = arr[:, :, :3][:, :, ::-1]   # BGRA → RGB
-        elif fmt == QImage.Format_RGB888:
-            ptr    = qimg.bits()
-            ptr.setsize(qimg.byteCount())
-            stride = qimg.bytesPerLine()
-            arr    = np.frombuffer(ptr, dtype=np.uint8).reshape(qimg.height(), stride)
-            self.preview_image = arr[:, :qimg.width() * 3].reshape(qimg.height(), qimg.width(), 3)
-        else:
-            print(f"Warning: unsupported QImage format {fmt} in get_visible_qimage_pixmap")
-            self.preview_image = None
+        # self.qimage wraps _contrast_buffer (RGB888 / Grayscale8), so slice
+        # the array directly: no QImage copy, no channel shuffling.  The one
+        # copy keeps the thumbnail from pinning the full-size buffer once
+        # the next contrast pass replaces it.
+        self.preview_image = self._contrast_buffer[y:y + h, x:x + w].copy()
 
     # ------------------------------------------------------------------
     # Contrast engine
@@ -615,20 +856,26 @@ class ImageViewer(QGraphicsView):
     # Two modes:
     #
     # FULL mode (slider released / initial load)
-    #   apply_contrast(min, max)
-    #   Builds a uint16→uint8 LUT (cached), applies lut[original_image],
-    #   stores self.qimage, updates the scene pixmap, resets sceneRect.
+    #   apply_contrast(min, max) / apply_contrast_async(min, max)
+    #   Stretches original_image via stretch_function (Numba kernel, or a
+    #   cached uint16→uint8 LUT without numba), stores self.qimage, shows a
+    #   thumbnail in image_item, resets sceneRect.  Tile pixmaps are built
+    #   per _tile_size tile, only for the tiles in view, at the power-of-two
+    #   pyramid level closest to the current zoom.
     #
     # PREVIEW mode (slider held)
     #   1. capture_preview_crop() — called once on slider_pressed.
     #      Slices the visible region from original_image (zero-copy view),
     #      optionally nearest-neighbour downsamples to viewport size.
     #   2. apply_preview_contrast(min, max) — called on every slider tick.
-    #      Stretches the crop with a reusable float32 scratch buffer,
-    #      updates image_item pixmap in-place. sceneRect never changes.
+    #      Applies the same stretch to the crop into a reusable uint8 buffer,
+    #      drops the tiles and updates image_item pixmap in-place.
+    #      sceneRect never changes.
     # ------------------------------------------------------------------
 
-    _MAX_LUT_CACHE = 64   # Evict oldest entries beyond this many cached LUTs
+    _MAX_LUT_CACHE   = 64    # Evict oldest entries beyond this many cached LUTs
+    _PREVIEW_LUT_STEP = 256  # Preview LUT keys snap to this grid (8-bit buckets)
+    _THUMB_MAX        = 2048 # Long side of the whole-image placeholder pixmap
 
     def _trim_lut_cache(self, cache: dict):
         """Evict oldest cache entries when cache exceeds _MAX_LUT_CACHE entries."""
@@ -642,14 +889,18 @@ class ImageViewer(QGraphicsView):
 
         Values below min_val → 0, above max_val → 255.
         The 65 536-entry float32 intermediate fits in L2 cache, so plain numpy
-        is sufficient here.
+        is sufficient here; the arithmetic runs in place on that one buffer,
+        leaving the final cast as the only other allocation.
         """
         n    = np.iinfo(input_dtype).max + 1
         diff = float(max_val - min_val)
         if diff == 0:
             return np.full(n, 255, dtype=output_dtype)
-        indices = np.arange(n, dtype=np.float32)
-        return np.clip((indices - min_val) * (255.0 / diff), 0, 255).astype(output_dtype)
+        lut  = np.arange(n, dtype=np.float32)
+        lut -= min_val
+        lut *= 255.0 / diff
+        np.clip(lut, 0, 255, out=lut)
+        return lut.astype(output_dtype)
 
     def capture_preview_crop(self):
         """
@@ -695,8 +946,7 @@ class ImageViewer(QGraphicsView):
             # Integer index arrays give nearest-neighbour without cv2/scipy
             row_idx = (np.arange(new_h) * (crop_h / new_h)).astype(np.intp)
             col_idx = (np.arange(new_w) * (crop_w / new_w)).astype(np.intp)
-            # np.ix_ produces a copy — intentional; _preview_float_buf must not
-            # alias original_image memory
+            # np.ix_ produces a copy so the crop does not pin original_image
             crop = crop[np.ix_(row_idx, col_idx)]
             self._preview_crop_scene_size = QSizeF(x1 - x0, y1 - y0)
         else:
@@ -707,45 +957,35 @@ class ImageViewer(QGraphicsView):
 
     def apply_preview_contrast(self, min_val: int, max_val: int):
         """
-        Stretch _preview_crop_raw in-place and update image_item without
-        touching sceneRect, preserving scroll position and zoom level.
+        Stretch _preview_crop_raw and update image_item without touching
+        sceneRect, preserving scroll position and zoom level.
 
-        Key implementation detail: the uint16 → float32 widening MUST happen
-        before the subtraction.  Using casting='unsafe' in np.subtract would
-        evaluate (uint16 - min_val) in uint16 arithmetic first, causing wrap-
-        around for pixels below min_val (e.g. 1000 - 5000 → 61536).
-        Instead we widen with np.copyto first, then do arithmetic in float32.
+        The stretch is the same one used by the full pass (stretch_function),
+        written into a uint8 buffer that is reused across ticks, so a slider
+        tick allocates nothing proportional to the crop size.
         """
         if self._preview_crop_raw is None:
             return
 
         crop = self._preview_crop_raw
-        diff = float(max_val - min_val)
         h, w = crop.shape[:2]
         c    = 3 if crop.ndim == 3 else 1
 
-        # Allocate or reuse the float32 scratch buffer
-        if (not hasattr(self, '_preview_float_buf') or
-                self._preview_float_buf.shape != crop.shape):
-            self._preview_float_buf = np.empty(crop.shape, dtype=np.float32)
-
-        if diff == 0:
-            out = np.full(crop.shape, 255, dtype=np.uint8)
-        else:
-            scale = 255.0 / diff
-            np.copyto(self._preview_float_buf, crop, casting='unsafe')  # uint16 → float32
-            self._preview_float_buf -= min_val   # in-place; no extra allocation
-            self._preview_float_buf *= scale
-            np.clip(self._preview_float_buf, 0, 255, out=self._preview_float_buf)
-            out = self._preview_float_buf.astype(np.uint8)  # final copy for QImage
+        # Allocate or reuse the uint8 output buffer
+        if self._preview_out_buf is None or self._preview_out_buf.shape != crop.shape:
+            self._preview_out_buf = np.empty(crop.shape, dtype=np.uint8)
+        out = self._preview_out_buf
+        self.stretch_function(min_val, max_val, preview=True)(crop, out=out)
 
         stride = c * w
-        # Keep buffer alive — QImage holds a raw pointer, not a copy
-        self._contrast_buffer = out
-        qimg   = QImage(self._contrast_buffer.data, w, h, stride,
+        # QImage holds a raw pointer into out; fromImage copies it before the
+        # next tick overwrites the buffer
+        qimg   = QImage(out.data, w, h, stride,
                         QImage.Format_RGB888 if c == 3 else QImage.Format_Grayscale8)
         pixmap = QPixmap.fromImage(qimg)
 
+        # The tiles sit above image_item and would hide the preview
+        self._clear_tiles()
         self.image_item.setPixmap(pixmap)
         self.image_item.setPos(self._preview_crop_scene_pos)
 
@@ -759,53 +999,301 @@ class ImageViewer(QGraphicsView):
 
         self.is_displaying_preview = True
 
+    def get_contrast_lut(self, min_val: int, max_val: int) -> np.ndarray:
+        """Return the cached uint16→uint8 LUT for (min_val, max_val), building it if needed."""
+        lut_key = (min_val, max_val)
+        if lut_key not in self.contrast_luts16:
+            self.contrast_luts16[lut_key] = self.create_contrast_lut(
+                min_val, max_val, self.original_image.dtype, np.uint8
+            )
+            self._trim_lut_cache(self.contrast_luts16)
+        return self.contrast_luts16[lut_key]
+
+    def stretch_function(self, min_val: int, max_val: int, preview: bool = False):
+        """
+        Return f(image, out=None) -> uint8 array for the (min_val, max_val)
+        window.  Uses the parallel Numba kernel when numba is installed and a
+        cached LUT lookup otherwise.
+
+        With *preview* (slider drag ticks) the LUT fallback snaps the window
+        outwards to _PREVIEW_LUT_STEP buckets (min down, max up), so a
+        continuous drag keeps hitting a few hundred cached LUTs instead of
+        building one per tick.  Windows narrower than a few buckets are not
+        snapped, since coarse buckets would visibly distort (or collapse)
+        them.  The full pass on slider release always uses the exact window.
+
+        Must be called on the GUI thread (it may touch the LUT cache); the
+        returned callable itself is safe to run in a worker.
+        """
+        if HAVE_NUMBA:
+            return partial(stretch_to_uint8, min_val=min_val, max_val=max_val)
+        step = self._PREVIEW_LUT_STEP
+        if preview and max_val - min_val >= 4 * step:
+            min_val = (min_val // step) * step
+            max_val = -(-max_val // step) * step
+        lut = self.get_contrast_lut(min_val, max_val)
+        # mode='clip' lets np.take write straight into out; the default
+        # 'raise' mode stages the result in a temporary buffer first
+        return partial(np.take, lut, mode='clip')
+
     def apply_contrast(self, min_val: int, max_val: int):
         """
-        Full-image LUT pass: build / look up a uint16→uint8 LUT, apply it to
-        original_image, store the result as self.qimage, and update the scene.
+        Full-image pass: stretch original_image to uint8 for (min_val,
+        max_val), store the result as self.qimage, and update the scene.
 
-        Called on slider release and on initial image load.
+        The viewer itself goes through apply_contrast_async (initial load and
+        slider releases); this synchronous variant is kept for callers that
+        need the result immediately.
         Always restores image_item to position (0,0) and rebuilds sceneRect.
         """
         if self.original_image is None:
             return
 
-        lut_key = (min_val, max_val)
-        if lut_key not in self.contrast_luts16:
-            self.contrast_luts16[lut_key] = self.create_contrast_lut(
-                min_val, max_val, self.original_image.dtype, np.uint8
-            )
-            self._trim_lut_cache(self.contrast_luts16)
-        lut = self.contrast_luts16[lut_key]
+        stretch = self.stretch_function(min_val, max_val)
+        self.contrast_range = (min_val, max_val)
+        # uint8, same shape as original_image
+        self._show_stretched(stretch(self.original_image, out=self._take_spare_buffer()))
 
-        stretched = lut[self.original_image]   # uint8, same shape as original_image
+    def apply_contrast_async(self, min_val: int, max_val: int, callback=None):
+        """
+        Same as apply_contrast, but the stretch of original_image runs in a
+        ContrastWorker thread (see workers.py) so the event loop stays live.
+
+        *callback* is invoked on the GUI thread once the new image is shown.
+        It is also invoked immediately if there is no image to stretch, so
+        callers can rely on it firing exactly once.
+        """
+        if self.original_image is None:
+            if callback:
+                callback()
+            return
+
+        # Only one pass at a time; a superseded pass still releases its caller
+        superseded = self._stop_contrast_thread()
+        if superseded:
+            superseded()
+
+        self._contrast_callback = callback
+        self.contrast_range     = (min_val, max_val)
+        self.contrast_thread    = QThread()
+        self.contrast_worker    = worker = ContrastWorker(
+            self.original_image, self.stretch_function(min_val, max_val),
+            out=self._take_spare_buffer()
+        )
+        worker.moveToThread(self.contrast_thread)
+
+        # The slots are bound to their worker rather than checking sender():
+        # deleteLater may already have destroyed the worker by the time a
+        # queued slot runs, and sender() then returns None
+        self.contrast_thread.started.connect(worker.run)
+        worker.finished.connect(self.contrast_thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        worker.finished.connect(partial(self._on_contrast_finished, worker))
+        worker.error.connect(self.contrast_thread.quit)
+        worker.error.connect(worker.deleteLater)
+        worker.error.connect(partial(self._on_contrast_error, worker))
+        self.contrast_thread.start()
+
+    def _on_contrast_finished(self, worker, stretched: np.ndarray):
+        """Main-thread slot called by ContrastWorker.finished."""
+        if worker is not self.contrast_worker:
+            return   # stale result from a pass superseded by _stop_contrast_thread
+        # The queued quit() has been delivered but the thread may still be
+        # unwinding; wait before dropping the last reference to the QThread
+        self.contrast_thread.quit()
+        self.contrast_thread.wait()
+        self.contrast_thread = None
+        self.contrast_worker = None
+        if self.original_image is not None and stretched.shape == self.original_image.shape:
+            self._show_stretched(stretched)
+        callback, self._contrast_callback = self._contrast_callback, None
+        if callback:
+            callback()
+
+    def _on_contrast_error(self, worker, message: str):
+        """
+        Main-thread slot called by ContrastWorker.error.  The previous
+        image stays on screen; the pending callback still fires so the
+        dock re-enables its sliders and restores the cursor.
+        """
+        if worker is not self.contrast_worker:
+            return
+        callback = self._stop_contrast_thread()
+        self.update_status(message)
+        logger.error(message)
+        if callback:
+            callback()
+
+    def _stop_contrast_thread(self):
+        """
+        Wait for any running ContrastWorker and discard its result.
+        Returns the callback that was pending for it (or None).
+        """
+        if self.contrast_thread:
+            self.contrast_thread.quit()
+            self.contrast_thread.wait()
+        callback = self._contrast_callback
+        self.contrast_thread    = None
+        self.contrast_worker    = None
+        self._contrast_callback = None
+        return callback
+
+    def _take_spare_buffer(self):
+        """
+        Hand out the recycled display buffer for the next full pass, or None
+        if there is none matching original_image.  The caller owns it from
+        here on; it is never the buffer currently on screen.
+        """
+        spare, self._spare_buffer = self._spare_buffer, None
+        if spare is None or spare.shape != self.original_image.shape:
+            return None
+        return spare
+
+    def _show_stretched(self, stretched: np.ndarray):
+        """
+        Wrap a stretched uint8 array in self.qimage and push it to the scene.
+
+        Only a thumbnail of the whole image becomes a pixmap here; image_item
+        shows it scaled up to the full scene extent.  Full-resolution pixmaps
+        are built per tile for the visible region by _update_visible_tiles,
+        so a large tile never needs one image-sized pixmap upload.
+        """
         h, w      = stretched.shape[:2]
         c         = 3 if stretched.ndim == 3 else 1
         stride    = c * w
 
+        # The outgoing buffer is no longer displayed; keep it for the next pass
+        previous = self._contrast_buffer
+        if previous is not None and previous is not stretched and previous.shape == stretched.shape:
+            self._spare_buffer = previous
+
         # Keep buffer alive — QImage does NOT copy the data
         self._contrast_buffer = stretched
         self.qimage = QImage(
             self._contrast_buffer.data, w, h, stride,
             QImage.Format_RGB888 if c == 3 else QImage.Format_Grayscale8
         )
-        pixmap           = QPixmap.fromImage(self.qimage)
+
+        scale = min(self._THUMB_MAX / max(h, w), 1.0)
+        thumb = stretched
+        if scale < 1.0:
+            thumb = cv2.resize(stretched, (max(1, int(w * scale)), max(1, int(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        pixmap           = self._array_to_pixmap(thumb)
         self.last_pixmap = pixmap
         self.is_displaying_preview = False
+        self._clear_tiles()
 
         if self.image_item:
             self.image_item.setPixmap(pixmap)
             self.image_item.setPos(0, 0)
-            self.image_item.setTransform(QTransform())   # clear any preview scale
         else:
             self.image_item = QGraphicsPixmapItem(pixmap)
+            self.image_item.setZValue(-2)   # below the tiles (-1) and all overlays (0)
             self.scene.addItem(self.image_item)
+        # Stretch the thumbnail over the full image extent (identity at 1:1)
+        self.image_item.setTransform(
+            QTransform.fromScale(w / pixmap.width(), h / pixmap.height())
+        )
 
         self.setSceneRect(QRectF(0, 0, w, h))
+        self._update_visible_tiles()
 
         if self.control_dock:
             self.control_dock.update_preview(self.last_pixmap)
 
+    @staticmethod
+    def _array_to_pixmap(array: np.ndarray) -> QPixmap:
+        """Convert a C-contiguous uint8 RGB or grayscale array to a QPixmap (copies)."""
+        h, w = array.shape[:2]
+        c    = 3 if array.ndim == 3 else 1
+        qimg = QImage(array.data, w, h, c * w,
+                      QImage.Format_RGB888 if c == 3 else QImage.Format_Grayscale8)
+        return QPixmap.fromImage(qimg)
+
+    def _update_visible_tiles(self):
+        """
+        Build tile pixmaps for the region in view and drop tiles more than
+        one tile width outside it, or from another pyramid level.
+
+        The level follows the zoom: below 1:1, tiles are area-averaged by the
+        largest power of two that still leaves at least screen resolution,
+        so Qt never has to shrink a full-resolution pixmap on every paint.
+        No tiles are needed while zoomed out far enough that the thumbnail in
+        image_item already has at least screen resolution.
+        """
+        if (self._contrast_buffer is None or self.last_pixmap is None
+                or self.is_displaying_preview):
+            return
+
+        img_h, img_w = self._contrast_buffer.shape[:2]
+        zoom = self.transform().m11()
+        if zoom * img_w <= self.last_pixmap.width():
+            self._clear_tiles()
+            return
+
+        level   = max(0, int(math.floor(-math.log2(zoom)))) if zoom < 1.0 else 0
+        span    = self._tile_size << level
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        keep    = self._tile_keys(visible.adjusted(-span, -span, span, span), level)
+        for key in self._tiles.keys() - keep:
+            self.scene.removeItem(self._tiles.pop(key))
+        self._build_tiles(visible, level)
+
+    def ensure_full_resolution(self, rect: QRectF):
+        """
+        Build any missing full-resolution tiles intersecting *rect* (scene
+        coordinates), regardless of zoom.  The exporter calls this before
+        rendering a region at native resolution; the next refresh_preview
+        (or release_full_resolution) drops the tiles again.
+        """
+        self._build_tiles(rect, 0)
+
+    def _build_tiles(self, rect: QRectF, level: int):
+        """Build any missing *level* tiles intersecting scene *rect*."""
+        if self._contrast_buffer is None or self.is_displaying_preview:
+            return
+        span = self._tile_size << level
+        for key in self._tile_keys(rect, level) - self._tiles.keys():
+            _, tx, ty = key
+            tile = self._contrast_buffer[ty:ty + span, tx:tx + span]
+            th, tw = tile.shape[:2]
+            if level:
+                tile = cv2.resize(tile, (max(1, -(-tw >> level)), max(1, -(-th >> level))),
+                                  interpolation=cv2.INTER_AREA)
+            item = QGraphicsPixmapItem(self._array_to_pixmap(np.ascontiguousarray(tile)))
+            item.setPos(tx, ty)
+            if level:
+                item.setTransform(QTransform.fromScale(tw / tile.shape[1], th / tile.shape[0]))
+            # Finer levels stack above coarser ones (the exporter's level 0
+            # tiles cover whatever level is on screen), all below overlays
+            item.setZValue(-1 - level / 64)
+            self.scene.addItem(item)
+            self._tiles[key] = item
+
+    def release_full_resolution(self):
+        """Drop all full-resolution tiles; refresh_preview rebuilds the visible ones."""
+        self._clear_tiles()
+
+    def _tile_keys(self, rect: QRectF, level: int = 0) -> set:
+        """Return the (level, tx, ty) keys of all *level* tiles intersecting scene *rect*."""
+        img_h, img_w = self._contrast_buffer.shape[:2]
+        rect = rect.intersected(QRectF(0, 0, img_w, img_h))
+        if rect.isEmpty():
+            return set()
+        t  = self._tile_size << level
+        x0 = int(rect.left()) // t * t
+        y0 = int(rect.top())  // t * t
+        x1 = min(img_w, int(rect.right())  + 1)
+        y1 = min(img_h, int(rect.bottom()) + 1)
+        return {(level, tx, ty) for ty in range(y0, y1, t) for tx in range(x0, x1, t)}
+
+    def _clear_tiles(self):
+        """Remove all display tiles from the scene."""
+        for item in self._tiles.values():
+            self.scene.removeItem(item)
+        self._tiles.clear()
+
     # ------------------------------------------------------------------
     # Zoom and viewport navigation
     # ------------------------------------------------------------------
@@ -849,8 +1337,24 @@ class ImageViewer(QGraphicsView):
             self.centerOn(scene_rect.center())
             self.refresh_preview()
 
+    def _schedule_refresh_preview(self, *_):
+        """Scrollbar valueChanged slot; see refresh_preview."""
+        self.refresh_preview()
+
     def refresh_preview(self):
-        """Ask the dock to redraw the navigator thumbnail."""
+        """
+        Schedule a tile and navigator update for the current view.  Calls
+        arriving while one is pending are absorbed by it.
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh_preview(self):
+        """
+        Bring the display tiles up to date with the current view and ask
+        the dock to redraw the navigator thumbnail.
+        """
+        self._update_visible_tiles()
         if self.control_dock and self.last_pixmap:
             self.control_dock.update_preview(self.last_pixmap)
 
@@ -954,69 +1458,58 @@ class ImageViewer(QGraphicsView):
         elif event.button() == Qt.RightButton:
             import sip
             # Remove an existing circle if the click is close enough to one
-            for ann in self.annotations[:]:
-                if sip.isdeleted(ann.item):
-                    self.annotations.remove(ann)
-                    continue
-                centre = ann.item.rect().center()
-                dist   = ((scene_pos.x() - centre.x()) ** 2 +
-                          (scene_pos.y() - centre.y()) ** 2) ** 0.5
-                if dist <= 10:
-                    self.scene.removeItem(ann.item)
-                    self.annotations.remove(ann)
-                    if self.control_dock:
-                        self.control_dock.update_coord_list(self.annotations)
-                        if self.control_dock.selected_circle == ann.item:
-                            self.control_dock.selected_circle = None
-                    self.viewport().update()
-                    return
+            ann = self._annotation_at(scene_pos, 10)
+            if ann is not None and sip.isdeleted(ann.item):
+                self._remove_annotation(ann)   # stale entry; treat as a miss
+                ann = None
+            if ann is not None:
+                self.scene.removeItem(ann.item)
+                self._remove_annotation(ann)
+                if self.control_dock:
+                    self.control_dock.update_coord_list(self.annotations)
+                    if self.control_dock.selected_circle == ann.item:
+                        self.control_dock.selected_circle = None
+                self.viewport().update()
+                return
             # No circle hit — show the classification context menu
             self._show_annotation_menu(event, scene_pos)
 
         super().mousePressEvent(event)
 
+    def _annotation_menu(self) -> QMenu:
+        """
+        Return the right-click classification menu, building it on first use.
+        Each action carries its "<category>: <label>" classifier in data().
+        """
+        if self._classifier_menu is None:
+            menu = QMenu(self)
+            for cat, entries in self.ANNOTATION_CATEGORIES.items():
+                for label in entries:
+                    full_label = f"{cat}: {label}"
+                    menu.addAction(full_label).setData(full_label)
+                menu.addSeparator()
+            self._classifier_menu = menu
+        return self._classifier_menu
+
     def _show_annotation_menu(self, event, scene_pos: QPointF):
-        """Build and execute the right-click annotation classification menu."""
-        menu = QMenu(self)
-
-        categories = {
-            "GL":  ["lens", "arc", "multiple image", "Einstein ring", "DSPL"],
-            "AGN": ["Seyfert 1", "outflow"],
-            "Gx":  ["Emissionline", "Ring", "Polar ring", "Stream",
-                    "Merger", "Irregular", "Dwarf", "weird"],
-        }
-        color_map = {
-            "GL":  QColor(0, 200, 255),
-            "AGN": QColor(220, 220, 0),
-            "Gx":  QColor(255, 50, 50),
-        }
-
-        action_to_label: dict = {}
-        for cat, entries in categories.items():
-            for label in entries:
-                full_label = f"{cat}: {label}"
-                action_to_label[menu.addAction(full_label)] = full_label
-            menu.addSeparator()
-
-        chosen = menu.exec_(self.mapToGlobal(event.pos()))
+        """Execute the right-click annotation classification menu."""
+        chosen = self._annotation_menu().exec_(self.mapToGlobal(event.pos()))
         if chosen and self.wcs and self.original_image is not None and self.start_ra_dec:
-            classifier = action_to_label[chosen]
-            cat_prefix = classifier.split(":")[0]
-            color      = color_map.get(cat_prefix, QColor(255, 255, 255))
-            thickness  = 2.0
+            classifier = chosen.data()
 
             item = QGraphicsEllipseItem(scene_pos.x() - 10, scene_pos.y() - 10, 20, 20)
-            item.setPen(QPen(color, thickness))
-            item.setZValue(10)
-            self.scene.addItem(item)
-
-            self.annotations.append(Annotation(
+            ann  = Annotation(
                 item=item,
                 ra=self.start_ra_dec[0],
                 dec=self.start_ra_dec[1],
                 classifier=classifier,
-                normal_thickness=thickness,
-            ))
+                normal_thickness=2.0,
+            )
+            item.setPen(self.annotation_pen(ann))
+            item.setZValue(10)
+            self.scene.addItem(item)
+
+            self._add_annotation(ann)
             if self.control_dock:
                 self.control_dock.update_coord_list(self.annotations)
             self.viewport().update()
@@ -1027,43 +1520,79 @@ class ImageViewer(QGraphicsView):
         if not self.wcs or not self.control_dock or self.original_image is None:
             return
 
-        self.current_point = self.mapToScene(event.pos())
+        self._pending_move_pos = self.mapToScene(event.pos())
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _process_pending_move(self):
+        """Cursor readout, rubber band and ruler update for the latest mouse position."""
+        scene_pos, self._pending_move_pos = self._pending_move_pos, None
+        if (scene_pos is None or not self.wcs or not self.control_dock
+                or self.original_image is None):
+            return
+
+        # Sub-pixel jitter changes neither the readout nor the ruler
+        int_pos = (int(scene_pos.x()), int(scene_pos.y()))
+        if int_pos == self._last_int_pos:
+            return
+        self._last_int_pos = int_pos
+
+        self.current_point = scene_pos
         # FITS images are stored bottom-up; Qt renders top-down — flip y before WCS calls
-        fy = self.original_image.shape[0] - self.current_point.y()
+        img_h = self.original_image.shape[0]
+        fy    = img_h - scene_pos.y()
 
         # Only update the magnifier when the cursor is actually over the image;
         # outside the image rect the magnifier would show edge pixels, which is
         # more confusing than showing nothing.
-        if self.sceneRect().contains(self.current_point):
-            self.control_dock.update_magnifier(self.current_point)
-            try:
-                ra, dec = self.wcs.pixel_to_world(self.current_point.x(), fy)
-                self.control_dock.update_cursor_display(self.current_point.x(), fy, ra, dec)
-            except Exception:
-                pass
-        else:
+        if not self.sceneRect().contains(scene_pos):
             self.control_dock.update_cursor_display(None, None, None, None)
             return
+        self.control_dock.update_magnifier(scene_pos)
 
-        # Rubber-band and measurement are mutually exclusive modes; the
-        # rubber-band check comes first so it returns before measurement logic.
+        # Rubber-band and measurement are mutually exclusive modes
+        band = None
         if self.rectangle_selection and self.rubber_band:
-            rect = QRectF(self.start_point, self.current_point).normalized()
-            self.rubber_band.setRect(rect)
-            if self.crosshair and self.crosshair.scene():
-                self.crosshair.setPos(rect.center())
-                ch_x = rect.center().x()
-                ch_y = self.original_image.shape[0] - rect.center().y()
-                self.crosshair_ra, self.crosshair_dec = self.wcs.pixel_to_world(ch_x, ch_y)
+            band = QRectF(self.start_point, scene_pos).normalized()
+        need_centre = band is not None and self.crosshair and self.crosshair.scene()
+        show_coords = self.control_dock.is_coord_display_visible()
+        need_cursor = show_coords or self.is_measuring
+
+        # Every point this tick needs in sky coordinates (the cursor for the
+        # readout / ruler, the rubber-band centre for the crosshair) goes
+        # through one wcs_pix2world call; none at all if nothing needs one
+        xs, ys = [], []
+        if need_cursor:
+            xs.append(scene_pos.x())
+            ys.append(fy)
+        if need_centre:
+            xs.append(band.center().x())
+            ys.append(img_h - band.center().y())
+        ras = decs = ()
+        if xs:
+            try:
+                ras, decs = self.wcs.pixels_to_world(xs, ys)
+            except Exception:
+                pass
+
+        ra = dec = None
+        if need_cursor and len(ras):
+            ra, dec = float(ras[0]), float(decs[0])
+        if show_coords and ra is not None:
+            self.control_dock.update_cursor_display(scene_pos.x(), fy, ra, dec)
+
+        if band is not None:
+            self.rubber_band.setRect(band)
+            if need_centre:
+                self.crosshair.setPos(band.center())
+                if len(ras):
+                    self.crosshair_ra, self.crosshair_dec = float(ras[-1]), float(decs[-1])
             return
 
         # Distance measurement ruler update
         if self.is_measuring and self.start_point and self.start_ra_dec:
-            try:
-                ra, dec = self.wcs.pixel_to_world(self.current_point.x(), fy)
+            if ra is not None:
                 self._update_measurement(ra, dec)
-            except Exception:
-                pass
             self.viewport().update()
 
     def _update_measurement(self, ra: float, dec: float):
@@ -1073,23 +1602,20 @@ class ImageViewer(QGraphicsView):
         Separations are converted to arcseconds or arcminutes depending on
         magnitude and stored as (value, unit_string) pairs for drawForeground.
         """
-        def _to_unit(deg: float):
-            if deg * 3600 < 60:
-                return deg * 3600, '"'
-            elif deg < 1:
-                return deg * 60, "'"
-            return None, None
-
-        s0 = SkyCoord(self.start_ra_dec[0] * u.deg, self.start_ra_dec[1] * u.deg, frame='icrs')
-        s1 = SkyCoord(ra * u.deg,                   dec * u.deg,                   frame='icrs')
-        sh = SkyCoord(ra * u.deg,                   self.start_ra_dec[1] * u.deg, frame='icrs')
-        sv = SkyCoord(self.start_ra_dec[0] * u.deg, dec * u.deg,                  frame='icrs')
-
-        self.angular_offset,    self.offset_unit    = _to_unit(s0.separation(s1).deg)
-        self.horizontal_offset, self.horizontal_unit = _to_unit(s0.separation(sh).deg)
-        self.vertical_offset,   self.vertical_unit   = _to_unit(s0.separation(sv).deg)
+        # Start, end and both leg ends are all ICRS, so plain haversine on
+        # floats replaces SkyCoord.separation on this per-move path
+        ra0, dec0 = self.start_ra_dec
+        self.angular_offset,    self.offset_unit    = _ruler_units(angular_separation_deg(ra0, dec0, ra, dec))
+        self.horizontal_offset, self.horizontal_unit = _ruler_units(angular_separation_deg(ra0, dec0, ra, dec0))
+        self.vertical_offset,   self.vertical_unit   = _ruler_units(angular_separation_deg(ra0, dec0, ra0, dec))
 
     def mouseReleaseEvent(self, event):
+        # Apply a still-pending move first, so the rubber band, its crosshair
+        # coordinates and the ruler reflect the final cursor position
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._process_pending_move()
+
         self.end_point        = self.mapToScene(event.pos())
         self.end_point_screen = event.pos()
 
@@ -1154,62 +1680,38 @@ class ImageViewer(QGraphicsView):
         # click target stays the same physical size regardless of zoom level.
         hit_radius = 10.0 / max(self.scale_factor, 0.01)
 
-        # MER catalog ellipses — use the scene's BspTree spatial index to get
-        # only the items near the click point instead of scanning all N items.
-        if self.catalog_manager and self.catalog_manager.MER_items:
-            search_rect = QRectF(
-                scene_pos.x() - hit_radius, scene_pos.y() - hit_radius,
-                hit_radius * 2,             hit_radius * 2,
-            )
-            nearby = self.scene.items(search_rect)
-            for ellipse in nearby:
-                if not isinstance(ellipse, QGraphicsEllipseItem):
-                    continue
-                if sip.isdeleted(ellipse):
-                    continue
-                if ellipse not in self.catalog_manager.MER_items:
-                    continue   # could be an annotation or selection-overlay item
-                centre = ellipse.rect().center()
-                dist   = ((scene_pos.x() - centre.x()) ** 2 +
-                          (scene_pos.y() - centre.y()) ** 2) ** 0.5
-                if dist <= hit_radius:
-                    oid = ellipse.data(0)
-                    if oid is not None and self.control_dock:
-                        self.control_dock.select_table_row(oid)
-                        # Reset all visible MER items to red, then highlight hit
-                        for other in self.catalog_manager.MER_items:
-                            if not sip.isdeleted(other) and other.isVisible():
-                                other.setPen(QPen(QColor(255, 0, 0), 1.0))
-                        ellipse.setPen(QPen(QColor(255, 255, 0), 1.5))
-                        self.scene.update()
-                    return True
+        # MER catalog ellipses — one numpy distance pass over the centres
+        # CatalogManager keeps parallel to MER_items; the nearest one wins.
+        manager = self.catalog_manager
+        if (manager and manager.MER_items
+                and len(manager.MER_centers) == len(manager.MER_items)):
+            d2 = ((manager.MER_centers - (scene_pos.x(), scene_pos.y())) ** 2).sum(axis=1)
+            i  = int(np.argmin(d2))
+            ellipse = manager.MER_items[i]
+            if (d2[i] <= hit_radius ** 2 and not sip.isdeleted(ellipse)
+                    and ellipse.isVisible()):
+                oid = ellipse.data(0)
+                if oid is not None and self.control_dock:
+                    self.control_dock.select_table_row(oid)
+                    self.highlight_MER(ellipse)
+                return True
 
         # User annotation circles
-        for ann in self.annotations:
-            if sip.isdeleted(ann.item):
-                continue
-            centre = ann.item.rect().center()
-            dist   = ((scene_pos.x() - centre.x()) ** 2 +
-                      (scene_pos.y() - centre.y()) ** 2) ** 0.5
-            if dist <= hit_radius:
-                if self.control_dock:
-                    self.control_dock.select_coord_list_item(ann.ra, ann.dec)
-                    # Reset the previously selected circle
-                    if (self.control_dock.selected_circle and
-                            not sip.isdeleted(self.control_dock.selected_circle) and
-                            self.control_dock.selected_circle != ann.item):
-                        for a in self.annotations:
-                            if a.item == self.control_dock.selected_circle:
-                                pen = a.item.pen()
-                                pen.setWidthF(a.normal_thickness)
-                                a.item.setPen(pen)
-                                break
-                    # Thicken the newly selected circle
-                    new_pen = QPen(ann.item.pen().color(), ann.normal_thickness * 1.5)
-                    ann.item.setPen(new_pen)
-                    self.control_dock.selected_circle = ann.item
-                    self.scene.update()
-                return True
+        ann = self._annotation_at(scene_pos, hit_radius)
+        if ann is not None and not sip.isdeleted(ann.item):
+            if self.control_dock:
+                self.control_dock.select_coord_list_item(ann.ra, ann.dec)
+                # Reset the previously selected circle
+                if (self.control_dock.selected_circle and
+                        not sip.isdeleted(self.control_dock.selected_circle) and
+                        self.control_dock.selected_circle != ann.item):
+                    prev = self.annotation_for_item(self.control_dock.selected_circle)
+                    if prev is not None:
+                        prev.item.setPen(self.annotation_pen(prev))
+                # Thicken the newly selected circle
+                ann.item.setPen(self.annotation_pen(ann, selected=True))
+                self.control_dock.selected_circle = ann.item
+            return True
 
         return False
 
@@ -1224,27 +1726,21 @@ class ImageViewer(QGraphicsView):
             # when two annotations share the same sky position.
             if (self.control_dock.selected_circle and
                     not sip.isdeleted(self.control_dock.selected_circle)):
-                for ann in self.annotations:
-                    if ann.item is self.control_dock.selected_circle:
-                        target_ann = ann
-                        break
+                target_ann = self.annotation_for_item(self.control_dock.selected_circle)
 
             # Priority 2: coord_list keyboard selection — fall back to
             # RA/Dec proximity only when no item is highlighted.
             if target_ann is None:
                 ra, dec = self.control_dock.get_selected_coord()
                 if ra is not None and dec is not None:
-                    for ann in self.annotations:
-                        if abs(ann.ra - ra) < 1e-5 and abs(ann.dec - dec) < 1e-5:
-                            target_ann = ann
-                            break
+                    target_ann = self.annotation_at_radec(ra, dec)
 
             if target_ann is not None:
                 if not sip.isdeleted(target_ann.item):
                     self.scene.removeItem(target_ann.item)
                 if self.control_dock.selected_circle is target_ann.item:
                     self.control_dock.selected_circle = None
-                self.annotations.remove(target_ann)
+                self._remove_annotation(target_ann)
                 self.control_dock.update_coord_list(self.annotations)
                 self.viewport().update()
 
@@ -1259,6 +1755,11 @@ class ImageViewer(QGraphicsView):
         self.refresh_preview()
         event.accept()
 
+    def resizeEvent(self, event):
+        """A larger viewport may uncover tiles that have not been built yet."""
+        super().resizeEvent(event)
+        self._schedule_refresh_preview()
+
     # ------------------------------------------------------------------
     # drawForeground — measurement ruler (Qt virtual hook)
     # ------------------------------------------------------------------
@@ -1282,15 +1783,11 @@ class ImageViewer(QGraphicsView):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Diagonal line
-        solid = QPen(QColor(255, 255, 0), 1, Qt.SolidLine)
-        solid.setCosmetic(True)
-        painter.setPen(solid)
+        painter.setPen(self._ruler_pen)
         painter.drawLine(self.start_point, self.current_point)
 
         # Right-triangle legs
-        dashed = QPen(QColor(255, 255, 0), 1, Qt.DashLine)
-        dashed.setCosmetic(True)
-        painter.setPen(dashed)
+        painter.setPen(self._ruler_dash_pen)
         corner = QPointF(self.current_point.x(), self.start_point.y())
         painter.drawLine(self.start_point, corner)
         painter.drawLine(corner, self.current_point)
@@ -1305,13 +1802,12 @@ class ImageViewer(QGraphicsView):
         hor_scene = QPointF(mid_scene.x(), self.start_point.y())
         ver_scene = QPointF(self.current_point.x(), mid_scene.y())
 
-        mid_vp = self.mapFromScene(mid_scene)
-        hor_vp = self.mapFromScene(hor_scene)
-        ver_vp = self.mapFromScene(ver_scene)
+        # One polygon mapping instead of three point mappings
+        mid_vp, hor_vp, ver_vp = self.mapFromScene(QPolygonF([mid_scene, hor_scene, ver_scene]))
 
         painter.setWorldMatrixEnabled(False)
-        painter.setFont(QFont("Arial", 10))
-        painter.setPen(QPen(QColor(255, 255, 0), 1))
+        painter.setFont(self._ruler_font)
+        painter.setPen(self._ruler_text_pen)
 
         if self.angular_offset is not None:
             painter.drawText(QPointF(mid_vp.x(),       mid_vp.y() - 10),
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# main_window.py - Main window of euniverse, a program to display MER colour images created with eummy
+
+# MIT License
+
+# Copyright (c) [2026] [Mischa Schirmer]
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+main_window.py — Top-level application window
+=============================================
+MainWindow hosts the ImageViewer as its central widget and the ControlDock
+in a left-side QDockWidget.
+
+It lives in its own module so that euniverse.main() can answer --help and
+--version before PyQt5 and the scientific stack are imported.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+from PyQt5.QtWidgets import QMainWindow
+from PyQt5.QtCore import Qt, QTimer
+
+from .image_viewer import ImageViewer
+from .control_dock import ControlDock
+
+logger = logging.getLogger(__name__)
+
+
+class MainWindow(QMainWindow):
+    # Dock placement for the control panel
+    _ALLOWED_DOCK_AREAS = Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea
+    _CONTROL_DOCK_AREA  = Qt.LeftDockWidgetArea
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Euniverse Explorer")
+        
+        # Centralized path management
+        self.base_path = Path(__file__).parent
+        
+        try:
+            self.init_ui()
+        except Exception as e:
+            logger.error(f"Failed to initialize UI: {e}")
+            self.critical_error(f"UI Initialization failed: {e}")
+            
+        self.resize(1280, 1080)
+
+    def init_ui(self):
+        """Builds the main layout and connects components."""
+        self.setDockOptions(QMainWindow.AllowNestedDocks | QMainWindow.AnimatedDocks)
+        
+        # Set all corners to belong to left/right docks (better for widescreen)
+        self.setCorner(Qt.TopLeftCorner, Qt.LeftDockWidgetArea)
+        self.setCorner(Qt.TopRightCorner, Qt.RightDockWidgetArea)
+        self.setCorner(Qt.BottomLeftCorner, Qt.LeftDockWidgetArea)
+        self.setCorner(Qt.BottomRightCorner, Qt.RightDockWidgetArea)
+        
+        # Central widget
+        self.viewer = ImageViewer(main_window=self)
+        self.setCentralWidget(self.viewer)
+        self.setStatusBar(self.viewer.status_bar)
+        
+        # Setup Control Dock once the event loop is running, so the
+        # window shell paints before the dock's widgets are built
+        QTimer.singleShot(0, self._setup_control_panel)
+        
+    def _setup_control_panel(self):
+        """Deferred from init_ui; reports failures like the constructor does."""
+        try:
+            self._build_control_panel()
+        except Exception as e:
+            logger.error(f"Failed to initialize control panel: {e}")
+            self.critical_error(f"UI Initialization failed: {e}")
+
+    def _build_control_panel(self):
+        """Internal helper to isolate docking logic."""
+        from PyQt5.QtWidgets import QDockWidget
+
+        self.control_widget = ControlDock(self.viewer)
+        self.control_dock = QDockWidget("Controls", self)
+        self.control_dock.setWidget(self.control_widget)
+        self.control_dock.setAllowedAreas(self._ALLOWED_DOCK_AREAS)
+        
+        # Optional: Keep title bar but make it small/clean
+        # self.control_dock.setTitleBarWidget(QWidget()) 
+        
+        self.addDockWidget(self._CONTROL_DOCK_AREA, self.control_dock)
+        self.viewer.set_control_dock(self.control_widget)
+
+    def critical_error(self, message):
+        """Graceful crash reporting."""
+        from PyQt5.QtWidgets import QMessageBox
+
+        QMessageBox.critical(self, "Critical Error", message)
+        sys.exit(1)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# euniverse.py - A program to display MER colour images created with eummy
+
+# MIT License
+
+# Copyright (c) [2026] [Mischa Schirmer]
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+pens.py — Shared QPen instances for scene overlays
+==================================================
+Overlay code styles many items at once: every MER ellipse, every annotation
+circle and the table/click highlight.  Building a fresh QPen for each of them
+churns Python wrappers and pen state for what are really a handful of
+distinct styles, so they all take their pens from shared_pen(), which hands
+out one cached instance per (colour, width).
+
+Cached pens are shared by many items — never mutate a pen obtained here;
+ask for a different (colour, width) instead.
+"""
+
+from PyQt5.QtGui import QPen, QColor
+
+# Maps (rgba, width) -> QPen
+_pens: dict = {}
+
+
+def shared_pen(color, width: float = 1.0) -> QPen:
+    """
+    Return the shared solid QPen for *color* (anything QColor accepts) and
+    *width*, creating it on first use.
+    """
+    color = QColor(color)
+    key   = (color.rgba(), width)
+    pen   = _pens.get(key)
+    if pen is None:
+        pen = _pens[key] = QPen(color, width)
+    return pen
@@ -26,9 +26,9 @@
 # SOFTWARE.
 
 import os
-from PyQt5.QtWidgets import QDialog, QAbstractItemView, QTableView, QVBoxLayout, QHeaderView, QGraphicsEllipseItem
+from PyQt5.QtWidgets import QDialog, QAbstractItemView, QTableView, QVBoxLayout, QHeaderView
 from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QPointF
-from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtGui import QColor, QPalette
 from astropy.table import Table, MaskedColumn
 import numpy as np
 
@@ -38,28 +38,63 @@ class CatalogTableModel(QAbstractTableModel):
     with support for filtering columns and preserving original data types.
     """
 
+    _MAX_DISPLAY_CACHE = 20000   # Formatted cells kept before the cache is dropped
+
     def __init__(self, catalog, required_columns=None, parent=None):
         super().__init__(parent)
         self.catalog = catalog
         self.required_columns = required_columns
         self.columns = self._get_visible_columns()
         self.data_types = self._get_column_data_types()
+        self.column_values, self.column_masks = self._get_column_data()
+        # data() runs for every painted cell; resolve alignment once per column
+        self.alignments = [
+            Qt.AlignRight | Qt.AlignVCenter if np.issubdtype(self.data_types[col], np.number)
+            else Qt.AlignLeft | Qt.AlignVCenter
+            for col in self.columns
+        ]
+        # (row, col) -> DisplayRole string; repaints and scrolling back over
+        # the same rows reuse it instead of formatting the value again
+        self._display_cache = {}
+        # Display order: view row -> catalog row, and its inverse.  None
+        # until the first sort (identity); the catalog itself is never
+        # reordered.
+        self._order = None
+        self._rank  = None
 
     def sort(self, column, order):
-        """Sort table by a column index."""
+        """
+        Sort table by a column index.
+
+        Only a row permutation is computed, from an argsort of the one sort
+        column; Table.sort would reorder every column of the (wide) MER
+        catalog in place, and the catalog is shared with CatalogManager.
+
+        The argsort is stable and runs over the current display order, so
+        rows that tie on the new column keep the order of the previous
+        sort: clicking MAG then FWHM sorts by FWHM, then by MAG.
+        """
         if self.catalog is None or len(self.catalog) == 0:
             return
 
         # Notify the view that the layout is about to change
         self.layoutAboutToBeChanged.emit()
 
-        # Get the name of the column to sort by
-        col_name = self.columns[column]
-        
-        # Astropy tables can be sorted in-place
-        # order == 0 is Ascending, order == 1 is Descending
-        reverse = (order == Qt.DescendingOrder)
-        self.catalog.sort(col_name, reverse=reverse)
+        # order == 0 is Ascending, order == 1 is Descending.  Descending
+        # sorts the reversed order ascending and flips the result, which
+        # keeps ties in their previous relative order as well.
+        current = self._order if self._order is not None else np.arange(len(self.catalog))
+        descending = (order == Qt.DescendingOrder)
+        if descending:
+            current = current[::-1]
+        keys = self.catalog[self.columns[column]][current]
+        perm = current[keys.argsort(kind='stable')]
+        if descending:
+            perm = perm[::-1]
+        self._order = np.ascontiguousarray(perm)
+        self._rank  = np.empty_like(self._order)
+        self._rank[self._order] = np.arange(len(self._order))
+        self._display_cache.clear()   # rows moved
 
         # Notify the view that the layout has changed
         self.layoutChanged.emit()
@@ -91,6 +126,35 @@ class CatalogTableModel(QAbstractTableModel):
             data_types[col] = self.catalog[col].dtype
         return data_types
 
+    def _get_column_data(self):
+        """
+        Gets the visible columns, in display order, as plain numpy arrays
+        plus a parallel list of boolean masks (None for columns without any
+        masked entry, so data() skips the mask test for them entirely).
+
+        data() indexes these directly: scalar indexing of a MaskedColumn
+        goes through numpy.ma and astropy machinery for every cell.
+        """
+        values, masks = [], []
+        for col in self.columns:
+            column = self.catalog[col]
+            if isinstance(column, MaskedColumn):
+                mask = np.ma.getmaskarray(column)
+                values.append(np.ma.getdata(column))
+                masks.append(mask if mask.any() else None)
+            else:
+                values.append(np.asarray(column))
+                masks.append(None)
+        return values, masks
+
+    def source_row(self, row):
+        """Catalog row shown at view *row*."""
+        return int(self._order[row]) if self._order is not None else row
+
+    def view_row(self, source_row):
+        """View row at which catalog row *source_row* is shown."""
+        return int(self._rank[source_row]) if self._rank is not None else source_row
+
     def rowCount(self, parent=QModelIndex()):
         return len(self.catalog) if self.catalog is not None else 0
 
@@ -103,36 +167,42 @@ class CatalogTableModel(QAbstractTableModel):
 
         row = index.row()
         col = index.column()
-        col_name = self.columns[col]
-        value = self.catalog[row][col_name]
 
         if role == Qt.DisplayRole:
-            # Handle Masked Values
-            if hasattr(value, 'mask') and value.mask:
-                return "" # Or "NaN" / "null" depending on preference
-
-            # Maintain Numeric Precision for Floats
-            if isinstance(value, (np.float32, np.float64)):
-                # trim=None ensures we don't truncate necessary precision
-                # positional=True avoids scientific notation unless necessary
-                return np.format_float_positional(value, trim='-') 
-            
-            # Fallback for integers and strings
-            return str(value)
+            text = self._display_cache.get((row, col))
+            if text is None:
+                if len(self._display_cache) >= self._MAX_DISPLAY_CACHE:
+                    self._display_cache.clear()
+                text = self._display_cache[(row, col)] = self._display_text(row, col)
+            return text
 
         elif role == Qt.TextAlignmentRole:
-            # Ensure we are checking the native numpy dtype to align columns
-            if np.issubdtype(self.catalog[col_name].dtype, np.number):
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-
-        elif role == Qt.BackgroundRole:
-            if row % 2 == 0:
-                return QColor(240, 240, 240)
-        
+            return self.alignments[col]
+
         return None
 
 
+    def _display_text(self, row, col):
+        """Format one cell for DisplayRole."""
+        # Column first: catalog[row] would build an astropy Row per cell
+        src  = self.source_row(row)
+        mask = self.column_masks[col]
+
+        # Handle Masked Values
+        if mask is not None and mask[src]:
+            return "" # Or "NaN" / "null" depending on preference
+
+        value = self.column_values[col][src]
+
+        # Maintain Numeric Precision for Floats
+        if isinstance(value, (np.float32, np.float64)):
+            # trim=None ensures we don't truncate necessary precision
+            # positional=True avoids scientific notation unless necessary
+            return np.format_float_positional(value, trim='-')
+
+        # Fallback for integers and strings
+        return str(value)
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
             return self.columns[section]
@@ -187,6 +257,11 @@ class TableDialog(QDialog):
         # 4. General View Settings
         self.table_view.setWordWrap(False)
         self.table_view.setAlternatingRowColors(True)
+        # Even rows light grey; the view paints them natively instead of the
+        # model answering BackgroundRole for every cell
+        palette = self.table_view.palette()
+        palette.setColor(QPalette.Base, QColor(240, 240, 240))
+        self.table_view.setPalette(palette)
         self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table_view.setSelectionMode(QAbstractItemView.SingleSelection)
 
@@ -225,12 +300,13 @@ class TableDialog(QDialog):
         self.resize(total_width, 400)
 
         self.selected_row = None
+        self._row_by_id   = None   # OBJECT_ID -> catalog row, built on first lookup
 
 
     def on_row_selected(self, index):
         """
         Handles row selection: highlights the matching ellipse yellow, resets
-        all others to red, and centres the viewer on the selected object.
+        the previous one to red, and centres the viewer on the selected object.
 
         Does NOT touch the viewer's drag mode — changing it here leaves the
         viewer stuck in NoDrag after the table click, breaking panning.
@@ -239,30 +315,37 @@ class TableDialog(QDialog):
             return
 
         self.selected_row = index.row()
-        object_id = self.catalog['OBJECT_ID'][index.row()]
+        object_id = self.catalog['OBJECT_ID'][self.table_model.source_row(index.row())]
 
-        for item in self.viewer.scene.items():
-            if not isinstance(item, QGraphicsEllipseItem):
-                continue
-            if item.data(0) == object_id:
-                item.setPen(QPen(QColor(255, 255, 0), 1.5))
-                center_scene = item.mapToScene(item.rect().center())
-                self.viewer.centerOn(center_scene)
-            elif item.data(0) is not None:
-                # Only reset items that belong to the MER catalog overlay
-                # (data(0) is set to OBJECT_ID by catalog_manager._make_ellipse)
-                item.setPen(QPen(QColor(255, 0, 0), 1.0))
-
-        self.viewer.scene.update()
+        item = self._mer_item(object_id)
+        if item is not None:
+            # highlight_MER restores the previously highlighted ellipse itself
+            self.viewer.highlight_MER(item)
+            self.viewer.centerOn(item.mapToScene(item.rect().center()))
 
     def _reset_highlights(self):
-        """Reset all MER ellipses to their default red colour."""
+        """Reset the highlighted MER ellipse to its default red colour."""
         if self.viewer is None:
             return
-        for item in self.viewer.scene.items():
-            if isinstance(item, QGraphicsEllipseItem) and item.data(0) is not None:
-                item.setPen(QPen(QColor(255, 0, 0), 1.0))
-        self.viewer.scene.update()
+        self.viewer.reset_MER_highlight()
+
+    def _mer_item(self, object_id):
+        """
+        Return the MER ellipse for *object_id*, or None.
+
+        The full overlay is looked up in CatalogManager.MER_by_id; only the
+        (small) lasso subset is scanned.
+        """
+        manager = self.viewer.catalog_manager
+        if manager is None:
+            return None
+        item = manager.MER_by_id.get(object_id)
+        if item is not None:
+            return item
+        for item in manager.selected_MER_items:
+            if item.data(0) == object_id:
+                return item
+        return None
 
     def closeEvent(self, event):
         """Reset any yellow highlight when the table is closed."""
@@ -273,11 +356,17 @@ class TableDialog(QDialog):
         if not self.catalog:
             return
 
-        # Find row with matching OBJECT_ID
-        for row in range(len(self.catalog)):
-            if self.catalog['OBJECT_ID'][row] == object_id:
-                index = self.table_model.index(row, 0)  # Get index for the first column
-                self.table_view.selectRow(row)
-                self.table_view.setCurrentIndex(index)
-                self.selected_row = row
-                return
+        # The model sorts through a permutation and never reorders the
+        # catalog, so the OBJECT_ID -> catalog row map stays valid; built
+        # reversed so the first of any duplicate IDs wins
+        if self._row_by_id is None:
+            ids = self.catalog['OBJECT_ID'].tolist()
+            self._row_by_id = dict(zip(reversed(ids), range(len(ids) - 1, -1, -1)))
+        source_row = self._row_by_id.get(object_id)
+        if source_row is None:
+            return
+        row = self.table_model.view_row(source_row)
+        index = self.table_model.index(row, 0)  # Get index for the first column
+        self.table_view.selectRow(row)
+        self.table_view.setCurrentIndex(index)
+        self.selected_row = row
@@ -25,9 +25,48 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import math
+
 import numpy as np
 from astropy.wcs import WCS
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def angular_separation_deg(ra1: float, dec1: float, ra2: float, dec2: float) -> float:
+    """
+    Great-circle distance in degrees between two (RA, Dec) positions in the
+    same frame, via the haversine formula (well conditioned at small angles).
+    Plain floats, no SkyCoord frame machinery — for per-mouse-move use.
+    """
+    r1 = math.radians(ra1)
+    d1 = math.radians(dec1)
+    r2 = math.radians(ra2)
+    d2 = math.radians(dec2)
+    s = (math.sin((d2 - d1) / 2) ** 2
+         + math.cos(d1) * math.cos(d2) * math.sin((r2 - r1) / 2) ** 2)
+    return math.degrees(2 * math.asin(min(1.0, math.sqrt(s))))
+
+
+if HAVE_NUMBA:
+    # Same source, compiled: the math calls become native code and the
+    # per-move ruler update skips Python's float-object dispatch
+    angular_separation_deg = njit(cache=True, fastmath=True)(angular_separation_deg)
+
+
+def warm_up_jit():
+    """
+    Trigger (or load from cache) the numba compilation of the ruler
+    helper, so the first measurement drag does not pay for it.
+    A no-op without numba.
+    """
+    if HAVE_NUMBA:
+        angular_separation_deg(0.0, 0.0, 0.0, 0.0)
+
 class WCSConverter:
     def __init__(self, metadata):
         self.metadata = metadata
@@ -43,27 +82,41 @@ class WCSConverter:
         self.wcs.wcs.equinox = metadata.get('EQUINOX', 2000.0)
 
     def pixel_to_world(self, x, y):
-        ra, dec = self.wcs.wcs_pix2world([[x, y]], 0)[0]
-        return ra, dec
+        """
+        Convert one pixel position to (ra, dec) in degrees as plain floats.
+
+        Goes straight to the low-level transform; no SkyCoord is built.
+        """
+        ra, dec = self._pix2world([[x, y]], 0)[0]
+        return float(ra), float(dec)
 
+    def pixels_to_world(self, xs, ys):
+        """
+        Vectorised pixel_to_world: convert sequences of x and y pixel
+        positions to arrays (ra, dec) in degrees with a single WCSLIB call.
+        """
+        ra, dec = self._pix2world(np.asarray(xs, dtype=float),
+                                  np.asarray(ys, dtype=float), 0)
+        return ra, dec
 
-    def world_to_pixel(self, sky_coord):
+    def worlds_to_pixels(self, ras, decs):
         """
-        Convert world coordinates (RA, Dec) to pixel coordinates (x, y).
-        
-        Args:
-        sky_coord (SkyCoord): Astropy SkyCoord object (single or array of coordinates).
-        
-        Returns:
-        tuple: Arrays (x, y) of pixel coordinates.
+        Inverse of pixels_to_world: convert sequences of RA and Dec in
+        degrees to arrays (x, y) of pixel positions (origin 0) with a single
+        WCSLIB call.
         """
-        ra = sky_coord.ra.deg
-        dec = sky_coord.dec.deg
-        # Ensure ra, dec are arrays
-        ra = np.atleast_1d(ra)
-        dec = np.atleast_1d(dec)
-        # Create input array of shape (N, 2) for all_world2pix
-        coords = np.column_stack((ra, dec))
-        # Convert to pixel coordinates (origin=0 for FITS convention)
-        x, y = self.wcs.all_world2pix(coords, 0).T
+        x, y = self._world2pix(np.asarray(ras, dtype=float),
+                               np.asarray(decs, dtype=float), 0)
         return x, y
+
+    @property
+    def _pix2world(self):
+        # all_pix2world only differs from the closed-form wcs_pix2world when
+        # distortion terms are present (never for the CD-only WCS built above)
+        return self.wcs.all_pix2world if self.wcs.has_distortion else self.wcs.wcs_pix2world
+
+    @property
+    def _world2pix(self):
+        # Likewise, all_world2pix's iterative solver is only needed with
+        # distortion terms; otherwise the closed-form inverse is exact
+        return self.wcs.all_world2pix if self.wcs.has_distortion else self.wcs.wcs_world2pix
@@ -39,18 +39,31 @@ Each worker follows the standard Qt pattern:
     worker.finished.connect(worker.deleteLater)
     thread.start()
 
-Two workers are defined:
+Four workers are defined:
 
-  TiffLoader   — loads a TIFF image and its JSON metadata from disk.
-                 Used by ImageViewer when the user opens a file.
+  TiffLoader     — loads a TIFF image and its JSON metadata from disk,
+                   and builds the navigator thumbnail.
+                   Used by ImageViewer when the user opens a file.
 
-  CsvUploader  — POSTs a CSV file to the Euclid target-receiver endpoint.
-                 Used by ControlDock when the user submits annotations.
+  CatalogLoader  — builds the CatalogManager (FITS MER catalog) for a tile.
+                   Used by ImageViewer right after a TIFF has loaded.
+
+  ContrastWorker — applies a contrast stretch to the full image.
+                   Used by ImageViewer when the user releases a slider.
+
+  CsvUploader    — POSTs a CSV file to the Euclid target-receiver endpoint.
+                   Used by ControlDock when the user submits annotations.
 """
 
+import os
 import json
 
+import cv2
 import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import tifffile
 
 from PyQt5.QtCore import QObject, pyqtSignal
@@ -58,6 +71,46 @@ from PyQt5.QtGui import QCursor
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
+from .catalog_manager import CatalogManager
+
+
+def _parse_metadata(desc) -> dict:
+    """
+    Parse the JSON ImageDescription of a MER tile.
+
+    Uses orjson when installed (accepts str or bytes as-is).  orjson is
+    strict RFC 8259 and rejects the NaN/Infinity tokens Python's json
+    writes, so anything it refuses is re-parsed with json before the
+    error is reported.  orjson.JSONDecodeError subclasses
+    json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(desc)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(desc)
+
+
+def _make_thumbnail(image: np.ndarray, max_size: int) -> np.ndarray:
+    """
+    Area-average *image* down so its longest axis is at most *max_size*.
+
+    RGB images are shifted to uint8 after the resize, so only the small
+    result is converted; grayscale keeps its dtype.
+    """
+    h, w  = image.shape[:2]
+    scale = min(max_size / max(h, w), 1.0)
+    if scale < 1.0:
+        new_h, new_w = max(1, int(h * scale)), max(1, int(w * scale))
+        small = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+    else:
+        small = np.array(image)   # already small enough; plain copy, no resampling
+    if image.ndim == 3:
+        return ((small >> 8).astype(np.uint8) if image.dtype == np.uint16
+                else small.astype(np.uint8, copy=False))
+    return small
+
 
 # ---------------------------------------------------------------------------
 # TiffLoader
@@ -71,20 +124,30 @@ class TiffLoader(QObject):
       - a single page (page 0) containing the image array
       - an 'ImageDescription' tag containing JSON-encoded WCS metadata
 
+    Uncompressed, contiguous pages in native byte order are memory-mapped
+    read-only instead of being read into the heap, so the pixels are paged
+    in by the OS as the thumbnail and contrast passes touch them.  Other
+    pages are decoded with asarray(), spreading the strips or tiles of
+    compressed pages over all cores (the codecs release the GIL).
+
+    The navigator thumbnail (longest axis ≤ preview_max) is built here as
+    well, so the GUI thread only does Qt work once the image arrives.
+
     Signals
     -------
-    finished(np.ndarray, dict, str)
-        Emitted on success with (image_array, metadata_dict, file_path).
+    finished(np.ndarray, np.ndarray, dict, str)
+        Emitted on success with (image_array, thumbnail, metadata_dict, file_path).
     error(str)
         Emitted on failure with a human-readable error message.
     """
 
-    finished = pyqtSignal(np.ndarray, dict, str)
+    finished = pyqtSignal(np.ndarray, np.ndarray, dict, str)
     error    = pyqtSignal(str)
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, preview_max: int = 1000):
         super().__init__()
-        self.path = path
+        self.path        = path
+        self.preview_max = preview_max
 
     def run(self):
         """Entry point — called by QThread.started signal."""
@@ -94,18 +157,28 @@ class TiffLoader(QObject):
             QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
 
             with tifffile.TiffFile(self.path) as tif:
-                image = tif.pages[0].asarray()
+                page = tif.pages[0]
 
-                if 'ImageDescription' not in tif.pages[0].tags:
+                if 'ImageDescription' not in page.tags:
                     raise ValueError("No ImageDescription tag found in TIFF metadata")
 
-                desc = tif.pages[0].tags['ImageDescription'].value
+                desc = page.tags['ImageDescription'].value
                 try:
-                    metadata = json.loads(desc)
+                    metadata = _parse_metadata(desc)
                 except json.JSONDecodeError:
                     raise ValueError("Invalid JSON in ImageDescription tag")
 
-            self.finished.emit(image, metadata, self.path)
+                image = None
+                if page.is_memmappable:
+                    image = tifffile.memmap(self.path, page=0, mode='r')
+                    if not image.dtype.isnative:
+                        # Byte-swapped data would need a converting copy anyway
+                        image = None
+                if image is None:
+                    image = page.asarray(maxworkers=os.cpu_count())
+
+            preview = _make_thumbnail(image, self.preview_max)
+            self.finished.emit(image, preview, metadata, self.path)
 
         except ValueError as ve:
             self.error.emit(str(ve))
@@ -116,6 +189,99 @@ class TiffLoader(QObject):
             QApplication.restoreOverrideCursor()
 
 
+# ---------------------------------------------------------------------------
+# CatalogLoader
+# ---------------------------------------------------------------------------
+
+class CatalogLoader(QObject):
+    """
+    Builds and loads a CatalogManager in a background thread, so reading
+    the FITS MER catalog overlaps the contrast stretch of the new image.
+
+    The manager is created here (load=False), its status messages are
+    relayed through this worker, and it is moved to *target_thread* (the GUI
+    thread) before being handed over — its ellipse items and signals are
+    used from there.
+
+    Signals
+    -------
+    status_updated(str, int)
+        Relayed CatalogManager.status_updated messages emitted during loading.
+    finished(object)
+        Emitted with the loaded CatalogManager.
+    error(str)
+        Emitted instead of finished if building the manager raised.
+    """
+
+    status_updated = pyqtSignal(str, int)
+    finished       = pyqtSignal(object)
+    error          = pyqtSignal(str)
+
+    def __init__(self, tileID: str, wcs, search_dir: str, target_thread):
+        super().__init__()
+        self._tileID        = tileID
+        self._wcs           = wcs
+        self._search_dir    = search_dir
+        self._target_thread = target_thread
+
+    def run(self):
+        """Entry point — called by QThread.started signal."""
+        try:
+            manager = CatalogManager(self._tileID, self._wcs, self._search_dir, load=False)
+            manager.status_updated.connect(self.status_updated)
+            manager.load()   # reports its own errors via status_updated
+            manager.status_updated.disconnect(self.status_updated)
+            manager.moveToThread(self._target_thread)
+        except Exception as e:
+            self.error.emit(f"Unexpected error loading MER catalog: {e}")
+            return
+        self.finished.emit(manager)
+
+
+# ---------------------------------------------------------------------------
+# ContrastWorker
+# ---------------------------------------------------------------------------
+
+class ContrastWorker(QObject):
+    """
+    Applies a uint16→uint8 contrast stretch to the full image in a
+    background thread.
+
+    *stretch* is a callable image -> uint8 array prepared on the GUI thread
+    (see ImageViewer.stretch_function), either the Numba kernel or a LUT
+    lookup.  Only that pass runs here.  If *out* is given, the result is
+    written into it instead of a freshly allocated array.  Building the QImage and QPixmap from
+    the result must happen on the GUI thread, so the stretched array is
+    handed back through the finished signal.
+
+    Signals
+    -------
+    finished(np.ndarray)
+        Emitted with the stretched uint8 array, same shape as the input.
+    error(str)
+        Emitted instead of finished if the stretch raised (e.g. a numba
+        compile error or MemoryError).
+    """
+
+    finished = pyqtSignal(np.ndarray)
+    error    = pyqtSignal(str)
+
+    def __init__(self, image: np.ndarray, stretch, out: np.ndarray = None):
+        super().__init__()
+        self._image   = image
+        self._stretch = stretch
+        self._out     = out
+
+    def run(self):
+        """Entry point — called by QThread.started signal."""
+        try:
+            stretched = self._stretch(self._image, out=self._out)
+        except Exception as e:
+            self.error.emit(f"Contrast stretch failed: {e}")
+            return
+        self.finished.emit(stretched)
+
+
 # ---------------------------------------------------------------------------
 # CsvUploader
 # ---------------------------------------------------------------------------
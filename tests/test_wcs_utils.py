@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("astropy")
+
+from euniverse.wcs_utils import angular_separation_deg
+
+# Pure-Python source of the helper; the numba dispatcher keeps it as py_func
+_py_separation = getattr(angular_separation_deg, "py_func", angular_separation_deg)
+
+CASES = [
+    ((0.0, 0.0, 0.0, 0.0), 0.0),
+    ((0.0, 0.0, 1.0, 0.0), 1.0),
+    ((0.0, 0.0, 0.0, 90.0), 90.0),
+    ((10.0, -30.0, 190.0, 30.0), 180.0),
+    ((359.5, 0.0, 0.5, 0.0), 1.0),
+    ((150.0, 60.0, 150.0, 60.0 + 1.0 / 3600.0), 1.0 / 3600.0),
+]
+
+
+@pytest.mark.parametrize("func", [_py_separation, angular_separation_deg],
+                         ids=["python", "compiled"])
+@pytest.mark.parametrize("args, expected", CASES)
+def test_angular_separation_deg(func, args, expected):
+    assert func(*args) == pytest.approx(expected, rel=1e-9, abs=1e-12)